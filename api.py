@@ -0,0 +1,238 @@
+"""Read-only JSON API over the indicator data.
+
+Serves the same indicators as the dashboard without going through a
+Streamlit session. Run it next to the app with:
+
+    python api.py --port 8502
+
+Endpoints:
+    /regions      list of regions
+    /indicators   list of indicators
+    /data         indicator rows, filtered by any of the query parameters
+                  region, area_type, indicator and gender (each may repeat)
+
+Responses are rendered once per query and data version and kept in
+memory together with their gzip encoding and ETag, so repeat requests
+only cost a dictionary lookup.
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import sys
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from education_data import (
+    KEY_COLUMNS,
+    VALUE_COLUMNS,
+    build_cube,
+    data_file,
+    data_version,
+    list_indicators,
+    list_regions,
+    read_data,
+)
+
+Response = namedtuple('Response', ['body', 'gzipped', 'etag'])
+# One loaded version of the data; swapped as a whole on reload, so a
+# response never mixes versions
+Snapshot = namedtuple('Snapshot', ['version', 'rows', 'cube'])
+
+# Query parameter -> column it filters on
+DATA_FILTERS = {
+    'region': 'Region',
+    'area_type': 'AreaType',
+    'indicator': 'Indicator',
+}
+MAX_CACHED_RESPONSES = 1024
+# Seconds between checks of the data file for a new version
+REFRESH_INTERVAL = 1.0
+
+
+class IndicatorStore:
+    """Indicator rows plus an LRU of rendered responses for one data version."""
+
+    def __init__(self, path=None):
+        self.path = data_file() if path is None else path
+        self.snapshot = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._responses = OrderedDict()
+        self.refresh(force=True)
+
+    def refresh(self, force=False):
+        # One thread checks and rebuilds at a time; the others keep
+        # serving the current version meanwhile
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+        try:
+            self._refresh(force)
+        finally:
+            self._refresh_lock.release()
+
+    def _refresh(self, force):
+        now = time.monotonic()
+        if not force and now - self._checked_at < REFRESH_INTERVAL:
+            return
+        self._checked_at = now
+        try:
+            version = data_version(self.path)
+            if self.snapshot is not None and version == self.snapshot.version:
+                return
+            rows = read_data(self.path)
+        except (OSError, ValueError) as e:
+            # A file being rewritten or failing validation: keep serving the
+            # previous version and try again on a later request
+            if self.snapshot is None:
+                raise
+            print(f"Keeping {self.snapshot.version}: cannot load {self.path}: {e}", file=sys.stderr)
+            return
+
+        # The API serves the rows as published; only the cube used for
+        # listings is filled out to the full grid
+        snapshot = Snapshot(version, rows.sort_values(KEY_COLUMNS, ignore_index=True), build_cube(rows))
+        with self._lock:
+            self.snapshot = snapshot
+            self._responses = OrderedDict()
+        # Render the responses every consumer starts from
+        for route in ('/regions', '/indicators', '/data'):
+            self.response(route, {})
+        for indicator in list_indicators(snapshot.cube):
+            self.response('/data', {'indicator': [indicator]})
+
+    def response(self, route, query):
+        key = (route, tuple(sorted((name, tuple(sorted(values))) for name, values in query.items())))
+        with self._lock:
+            cached = self._responses.get(key)
+            if cached is not None:
+                self._responses.move_to_end(key)
+                return cached
+            snapshot = self.snapshot
+
+        payload = ROUTES[route](snapshot, query)
+        body = json.dumps({'version': snapshot.version, 'data': payload}).encode('utf-8')
+        etag = '"{}"'.format(hashlib.sha1(snapshot.version.encode() + repr(key).encode()).hexdigest())
+        response = Response(body, gzip.compress(body), etag)
+
+        with self._lock:
+            if snapshot is self.snapshot:
+                self._responses[key] = response
+                if len(self._responses) > MAX_CACHED_RESPONSES:
+                    self._responses.popitem(last=False)
+        return response
+
+
+# Route handlers read only the snapshot they are given
+def regions(snapshot, query):
+    _check_parameters(query, ())
+    return list_regions(snapshot.cube)
+
+
+def indicators(snapshot, query):
+    _check_parameters(query, ())
+    return list_indicators(snapshot.cube)
+
+
+def data(snapshot, query):
+    _check_parameters(query, tuple(DATA_FILTERS) + ('gender',))
+    rows = snapshot.rows
+    mask = None
+    for name, column in DATA_FILTERS.items():
+        if name in query:
+            matches = rows[column].isin(query[name])
+            mask = matches if mask is None else mask & matches
+    if mask is not None:
+        rows = rows[mask]
+
+    genders = query.get('gender', VALUE_COLUMNS)
+    unknown = [gender for gender in genders if gender not in VALUE_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown gender: {', '.join(unknown)}")
+    columns = ['Region', 'AreaType', 'Indicator'] + [c for c in VALUE_COLUMNS if c in genders]
+    # Rates for an area a region lacks are NaN, which JSON spells null
+    rows = rows[columns].astype(object).where(rows[columns].notna(), None)
+    return rows.to_dict('records')
+
+
+ROUTES = {
+    '/regions': regions,
+    '/indicators': indicators,
+    '/data': data,
+}
+
+
+def _check_parameters(query, allowed):
+    unknown = sorted(set(query) - set(allowed))
+    if unknown:
+        raise ValueError(f"Unknown query parameter: {', '.join(unknown)}")
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    store = None
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path not in ROUTES:
+            return self._send_error(404, f"Unknown endpoint: {url.path}")
+        self.store.refresh()
+        try:
+            response = self.store.response(url.path, parse_qs(url.query))
+        except ValueError as e:
+            return self._send_error(400, str(e))
+
+        if_none_match = self.headers.get('If-None-Match', '')
+        if response.etag in (tag.strip() for tag in if_none_match.split(',')):
+            self.send_response(304)
+            self.send_header('ETag', response.etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        use_gzip = 'gzip' in self.headers.get('Accept-Encoding', '')
+        body = response.gzipped if use_gzip else response.body
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', response.etag)
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Vary', 'Accept-Encoding')
+        if use_gzip:
+            self.send_header('Content-Encoding', 'gzip')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status, message):
+        body = json.dumps({'error': message}).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the indicator data as JSON.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8502)
+    parser.add_argument('--data', default=None, help="CSV file to serve (default: latest data_<year>.csv)")
+    args = parser.parse_args()
+
+    ApiHandler.store = IndicatorStore(args.data)
+    server = ThreadingHTTPServer((args.host, args.port), ApiHandler)
+    print(f"Serving indicator data on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,11 @@
 import streamlit as st
-import pandas as pd
 import plotly.express as px
 
+from education_data import DISTRICT, data_version, latest_year
+from filters import load_cube, load_equity, load_labels
+from formatting import percent
+from memory import finish_page, track_page
+
 # Set page config
 st.set_page_config(
     page_title="Overview - Education Access in Faisalabad",
@@ -9,27 +13,11 @@ st.set_page_config(
     layout="wide",
     initial_sidebar_state="collapsed"
 )
+track_page(__file__)
 
-# Helper functions
-@st.cache_data
-def format_large_number(num):
-    if num >= 1_000_000:
-        return f"{num/1_000_000:.1f}M"
-    elif num >= 1_000:
-        return f"{num/1_000:.1f}K"
-    return str(num)
-
-# Load and prepare data with caching
-@st.cache_data(ttl=3600)
-def load_data():
-    df = pd.read_csv('data_2023.csv')
-    # Pre-calculate common filters
-    df['is_literacy'] = df['Indicator'] == 'Literate %'
-    df['is_out_of_school'] = df['Indicator'] == 'Out of School Children (5-16)'
-    df['is_never_attended'] = df['Indicator'] == 'Never to School (all)'
-    return df
-
-df = load_data()
+# Validated once per data version, so every lookup below exists
+version = data_version()
+cube = load_cube(version)
 
 # Custom CSS with SDG color scheme
 st.markdown("""
@@ -158,11 +146,11 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Hero Section
-st.markdown("""
+st.markdown(f"""
 <div class="hero-container">
     <h1 class="hero-title">📚 Education Access in Faisalabad</h1>
     <p class="hero-subtitle">Exploring Educational Disparities and SDG 4 Progress</p>
-    <div class="sdg-pill">SDG 4: Quality Education • Census 2023</div>
+    <div class="sdg-pill">SDG 4: Quality Education • Census {latest_year()}</div>
     <p style="margin-top: 1rem; font-size: 0.9rem; color: #666;">
         Data Source: <a href="https://www.pbs.gov.pk/digital-census/detailed-results" target="_blank" style="color: #E5243B;">Pakistan Bureau of Statistics Digital Census 2023</a><br>
         Developed by Global Shapers Faisalabad Hub
@@ -173,29 +161,21 @@ st.markdown("""
 # Key Metrics Row
 col1, col2, col3 = st.columns(3)
 
-# Calculate key metrics
-total_out_of_school = df[
-    (df['is_out_of_school']) & 
-    (df['AreaType'] == 'Total') & 
-    (df['Region'] == 'Faisalabad District')
-]['Total'].values[0]
+# Key metrics, from labels formatted once per data version
+labels = load_labels(version).compact
+total_out_of_school = labels.loc[(DISTRICT, 'Total', 'Out of School Children (5-16)'), 'Total']
 
-lowest_female_literacy = df[
-    (df['is_literacy']) & 
-    (df['AreaType'] == 'Rural')
-]['Female'].min()
+lowest_female_literacy = percent(
+    cube.xs(('Rural', 'Literate %'), level=('AreaType', 'Indicator'))['Female'].min()
+)
 
-total_never_attended = df[
-    (df['is_never_attended']) & 
-    (df['AreaType'] == 'Total') & 
-    (df['Region'] == 'Faisalabad District')
-]['Total'].values[0]
+total_never_attended = labels.loc[(DISTRICT, 'Total', 'Never to School (all)'), 'Total']
 
 with col1:
     st.markdown(f"""
     <div class="metric-card">
         <div class="metric-label">OUT OF SCHOOL CHILDREN</div>
-        <div class="metric-value">{format_large_number(total_out_of_school)}</div>
+        <div class="metric-value">{total_out_of_school}</div>
         <div class="metric-subtext">Ages 5-16 not in education</div>
     </div>
     """, unsafe_allow_html=True)
@@ -204,7 +184,7 @@ with col2:
     st.markdown(f"""
     <div class="metric-card">
         <div class="metric-label">LOWEST FEMALE LITERACY</div>
-        <div class="metric-value">{lowest_female_literacy:.1f}%</div>
+        <div class="metric-value">{lowest_female_literacy}</div>
         <div class="metric-subtext">In rural areas</div>
     </div>
     """, unsafe_allow_html=True)
@@ -213,19 +193,13 @@ with col3:
     st.markdown(f"""
     <div class="metric-card">
         <div class="metric-label">NEVER ATTENDED SCHOOL</div>
-        <div class="metric-value">{format_large_number(total_never_attended)}</div>
+        <div class="metric-value">{total_never_attended}</div>
         <div class="metric-subtext">Total population</div>
     </div>
     """, unsafe_allow_html=True)
 
 # Calculate additional insights
-urban_rural_literacy = df[
-    (df['is_literacy']) & 
-    (df['Region'] == 'Faisalabad District')
-]
-urban_literacy = urban_rural_literacy[urban_rural_literacy['AreaType'] == 'Urban']['Total'].values[0]
-rural_literacy = urban_rural_literacy[urban_rural_literacy['AreaType'] == 'Rural']['Total'].values[0]
-literacy_gap = urban_literacy - rural_literacy
+literacy_gap = load_equity(version).parity.loc[(DISTRICT, 'Literate %'), 'Urban-rural gap']
 
 # Divider
 st.markdown("<div class='divider'></div>", unsafe_allow_html=True)
@@ -246,7 +220,7 @@ with col1:
             with urban areas showing consistently higher rates.
         </div>
         <div class="insight-stat">
-            {literacy_gap:.1f}% urban-rural gap
+            {percent(literacy_gap)} urban-rural gap
         </div>
         <a href="Literacy_Rates" class="view-details-btn">View Detailed Analysis →</a>
     </div>
@@ -261,7 +235,7 @@ with col2:
             Analysis of children aged 5-16 who are currently not enrolled in any educational institution.
         </div>
         <div class="insight-stat">
-            {format_large_number(total_out_of_school)} children
+            {total_out_of_school} children
         </div>
         <a href="Out_of_School" class="view-details-btn">View Detailed Analysis →</a>
     </div>
@@ -276,8 +250,10 @@ with col3:
             Population that has never had access to formal education, highlighting systemic barriers.
         </div>
         <div class="insight-stat">
-            {format_large_number(total_never_attended)} people
+            {total_never_attended} people
         </div>
         <a href="Never_Attended" class="view-details-btn">View Detailed Analysis →</a>
     </div>
     """, unsafe_allow_html=True)
+
+finish_page()
@@ -0,0 +1,397 @@
+"""Tehsil boundaries, simplified once and cached at several resolutions.
+
+The GeoJSON source is split into arcs: runs of boundary shared by the
+same polygons, so a border between two tehsils is stored once. Every arc
+vertex gets a Douglas-Peucker significance (the largest tolerance at which
+it survives simplification), computed once. Simplifying at a tolerance is
+then a threshold on that array, and because neighbours share arcs they
+stay seamless at every resolution.
+
+Arcs, significances and feature structure are cached next to the source
+as a compact ``.npz`` of quantised integer coordinates and rebuilt when
+the source file changes.
+"""
+import json
+import os
+import tempfile
+import zipfile
+
+import numpy as np
+
+from education_data import data_version
+
+BOUNDARY_FILE = 'faisalabad_tehsils.geojson'
+# Simplification tolerance in degrees per resolution, finest first
+RESOLUTIONS = {
+    'high': 0.0002,
+    'medium': 0.001,
+    'low': 0.005,
+}
+# Coordinates are snapped to this grid (about 1 m) so shared vertices match
+QUANTIZE_SCALE = 1e5
+# Cells per side of the spatial index grid
+INDEX_GRID_SIZE = 64
+# Feature properties that may hold the tehsil name
+NAME_PROPERTIES = ['Region', 'region', 'name', 'NAME', 'tehsil', 'TEHSIL', 'shapeName']
+
+
+def cache_path(path=BOUNDARY_FILE):
+    return os.path.splitext(path)[0] + '.topo.npz'
+
+
+def feature_region(properties):
+    # Match the data's Region labels, e.g. 'Jaranwala' -> 'Jaranwala Tehsil'
+    for key in NAME_PROPERTIES:
+        name = properties.get(key)
+        if name:
+            name = str(name).strip()
+            return name if name.endswith('Tehsil') else f"{name} Tehsil"
+    return None
+
+
+def _feature_polygons(geometry):
+    if not geometry:
+        return []
+    if geometry['type'] == 'Polygon':
+        return [geometry['coordinates']]
+    if geometry['type'] == 'MultiPolygon':
+        return geometry['coordinates']
+    return []
+
+
+def _split_rings(rings):
+    """Split quantised rings into shared arcs.
+
+    ``rings`` is a list of (n, 2) int arrays without the closing point.
+    Returns ``(arcs, ring_arcs)`` where ``ring_arcs[i]`` lists
+    ``(arc_index, reversed)`` pairs that rebuild ring ``i``.
+    """
+    # A vertex is a junction when its neighbours differ between the rings
+    # using it, i.e. it has more than two distinct neighbours
+    neighbours = {}
+    for ring in rings:
+        points = [tuple(p) for p in ring]
+        for i, point in enumerate(points):
+            adjacent = neighbours.setdefault(point, set())
+            adjacent.add(points[i - 1])
+            adjacent.add(points[(i + 1) % len(points)])
+    junctions = {point for point, adjacent in neighbours.items() if len(adjacent) > 2}
+
+    arcs = []
+    arc_ids = {}
+    ring_arcs = []
+    for ring in rings:
+        points = [tuple(p) for p in ring]
+        starts = [i for i, point in enumerate(points) if point in junctions]
+        if not starts:
+            # No junctions: one closed arc, started at its smallest vertex
+            # so a ring shared whole (e.g. an enclave) is still stored once
+            starts = [points.index(min(points))]
+        # Rotate so the ring starts on a junction, then cut at each one
+        offset = starts[0]
+        points = points[offset:] + points[:offset]
+        cuts = [i - offset for i in starts] + [len(points)]
+        points.append(points[0])
+
+        pieces = []
+        for start, end in zip(cuts, cuts[1:]):
+            arc = tuple(points[start:end + 1])
+            if arc in arc_ids:
+                pieces.append((arc_ids[arc], False))
+            elif arc[::-1] in arc_ids:
+                pieces.append((arc_ids[arc[::-1]], True))
+            else:
+                arc_ids[arc] = len(arcs)
+                arcs.append(np.array(arc, dtype=np.int64))
+                pieces.append((arc_ids[arc], False))
+        ring_arcs.append(pieces)
+    return arcs, ring_arcs
+
+
+def _significance(arc):
+    """Douglas-Peucker significance of every vertex of an arc, in grid units.
+
+    Endpoints are always kept. A vertex's significance is capped by its
+    parent's, so thresholding reproduces Douglas-Peucker at any tolerance.
+    """
+    points = arc.astype(float)
+    significance = np.zeros(len(points))
+    significance[0] = significance[-1] = np.inf
+    closed = len(points) > 2 and np.array_equal(points[0], points[-1])
+
+    stack = [(0, len(points) - 1, np.inf)]
+    if closed:
+        # Split a closed loop at its farthest vertex so it keeps an area
+        far = 1 + int(np.argmax(np.hypot(*(points[1:-1] - points[0]).T)))
+        significance[far] = np.inf
+        stack = [(0, far, np.inf), (far, len(points) - 1, np.inf)]
+
+    while stack:
+        start, end, cap = stack.pop()
+        if end - start < 2:
+            continue
+        inner = points[start + 1:end]
+        a, b = points[start], points[end]
+        ab = b - a
+        length = np.hypot(*ab)
+        if length == 0:
+            distances = np.hypot(*(inner - a).T)
+        else:
+            distances = np.abs(ab[0] * (inner[:, 1] - a[1]) - ab[1] * (inner[:, 0] - a[0])) / length
+        split = start + 1 + int(np.argmax(distances))
+        value = min(float(distances.max()), cap)
+        significance[split] = value
+        stack.append((start, split, value))
+        stack.append((split, end, value))
+    return significance
+
+
+def build_cache(path=BOUNDARY_FILE):
+    with open(path) as f:
+        geojson = json.load(f)
+
+    rings = []
+    features = []
+    for feature in geojson['features']:
+        polygons = []
+        for polygon in _feature_polygons(feature.get('geometry')):
+            ring_ids = []
+            for ring in polygon:
+                coords = np.rint(np.asarray(ring, dtype=float)[:, :2] * QUANTIZE_SCALE).astype(np.int64)
+                if len(coords) > 1 and np.array_equal(coords[0], coords[-1]):
+                    coords = coords[:-1]
+                # Drop repeated vertices left over from quantising
+                keep = np.any(coords != np.roll(coords, 1, axis=0), axis=1)
+                coords = coords[keep] if keep.any() else coords[:1]
+                if len(coords) < 3:
+                    continue
+                ring_ids.append(len(rings))
+                rings.append(coords)
+            if ring_ids:
+                polygons.append(ring_ids)
+        # Features with no geometry, or none left after quantising, cannot
+        # be drawn or located
+        if not polygons:
+            continue
+        features.append({
+            'region': feature_region(feature.get('properties') or {}),
+            'polygons': polygons,
+        })
+
+    arcs, ring_arcs = _split_rings(rings)
+    offsets = np.cumsum([0] + [len(arc) for arc in arcs])
+    coords = np.concatenate(arcs) if arcs else np.zeros((0, 2), dtype=np.int64)
+    # Delta-encode each arc so coordinates fit in small integers
+    deltas = coords.copy()
+    deltas[1:] -= coords[:-1]
+    deltas[offsets[:-1]] = coords[offsets[:-1]]
+    significance = np.concatenate([_significance(arc) for arc in arcs]) if arcs else np.zeros(0)
+
+    structure = {'features': features, 'rings': ring_arcs}
+    # Write next to the cache and swap it in, so a reader never sees a
+    # half-written file
+    cache_file = cache_path(path)
+    fd, temp_file = tempfile.mkstemp(suffix='.npz', dir=os.path.dirname(cache_file) or '.')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.savez_compressed(
+                f,
+                version=np.array(data_version(path)),
+                deltas=deltas.astype(np.int32),
+                offsets=offsets,
+                significance=(significance / QUANTIZE_SCALE).astype(np.float32),
+                structure=np.array(json.dumps(structure)),
+            )
+        os.replace(temp_file, cache_file)
+    except BaseException:
+        os.remove(temp_file)
+        raise
+
+
+class Boundaries:
+    """Cached arc topology that materialises GeoJSON at any resolution."""
+
+    def __init__(self, cache_file):
+        with np.load(cache_file) as data:
+            self.version = str(data['version'])
+            offsets = data['offsets']
+            self.significance = data['significance']
+            deltas = data['deltas'].astype(np.int64)
+            structure = json.loads(str(data['structure']))
+
+        # Undo the per-arc delta encoding with one cumulative sum
+        starts = offsets[:-1]
+        restart = np.zeros(len(deltas), dtype=np.int64)
+        restart[starts] = 1
+        arc_index = np.cumsum(restart) - 1
+        cumulative = np.cumsum(deltas, axis=0)
+        base = cumulative[starts] - deltas[starts]
+        self.coords = (cumulative - base[arc_index]) / QUANTIZE_SCALE
+        self.offsets = offsets
+        self.features = structure['features']
+        self.ring_arcs = structure['rings']
+        self._geojson = {}
+        self._index = None
+
+    @property
+    def index(self):
+        # Built on first lookup, then kept with the boundaries
+        if self._index is None:
+            full_detail = np.ones(len(self.coords), dtype=bool)
+            self._index = SpatialIndex([
+                [self._assemble(ring, full_detail) for polygon in feature['polygons'] for ring in polygon]
+                for feature in self.features
+            ])
+        return self._index
+
+    def locate(self, lon, lat):
+        """Region whose boundary contains the point, or None."""
+        feature = self.index.locate(lon, lat)
+        return None if feature is None else self.features[feature]['region']
+
+    @property
+    def regions(self):
+        return [feature['region'] for feature in self.features]
+
+    def bounds(self, regions=None):
+        """(min_lon, min_lat, max_lon, max_lat) of the given regions."""
+        arcs = {
+            arc for feature in self.features
+            if regions is None or feature['region'] in regions
+            for polygon in feature['polygons'] for ring in polygon
+            for arc, _ in self.ring_arcs[ring]
+        }
+        points = np.concatenate([self.coords[self.offsets[a]:self.offsets[a + 1]] for a in arcs])
+        return (*points.min(axis=0), *points.max(axis=0))
+
+    def geojson(self, resolution):
+        """FeatureCollection simplified to ``resolution``, keyed by Region."""
+        if resolution in self._geojson:
+            return self._geojson[resolution]
+        tolerance = RESOLUTIONS[resolution]
+        keep = self.significance > tolerance
+
+        features = []
+        for feature in self.features:
+            polygons = []
+            for polygon in feature['polygons']:
+                rings = [self._ring(ring, keep) for ring in polygon]
+                if rings[0] is not None:
+                    polygons.append([ring for ring in rings if ring is not None])
+            features.append({
+                'type': 'Feature',
+                'properties': {'Region': feature['region']},
+                'geometry': {'type': 'MultiPolygon', 'coordinates': polygons},
+            })
+        self._geojson[resolution] = {'type': 'FeatureCollection', 'features': features}
+        return self._geojson[resolution]
+
+    def _assemble(self, ring, keep):
+        # Closed (n, 2) array of the ring's kept vertices
+        segments = []
+        for arc, reverse in self.ring_arcs[ring]:
+            start, end = self.offsets[arc], self.offsets[arc + 1]
+            segment = self.coords[start:end][keep[start:end]]
+            if reverse:
+                segment = segment[::-1]
+            segments.append(segment[1:] if segments else segment)
+        return np.concatenate(segments)
+
+    def _ring(self, ring, keep):
+        points = self._assemble(ring, keep)
+        if len(points) < 4:
+            # Too small to survive this tolerance; keep it at full detail
+            points = self._assemble(ring, np.ones(len(keep), dtype=bool))
+        return np.round(points, 5).tolist() if len(points) >= 4 else None
+
+
+class SpatialIndex:
+    """Uniform grid over feature bounding boxes for point lookups.
+
+    Each grid cell lists the features whose bounding box overlaps it, so a
+    lookup tests only the one or two candidates in the point's cell, each
+    with a single vectorised even-odd test over that feature's edges
+    (holes fall out of the even-odd rule).
+    """
+
+    def __init__(self, feature_rings, grid_size=INDEX_GRID_SIZE):
+        # Positions in the index -> feature numbers; features without
+        # rings are left out
+        self.features = []
+        self.edges = []
+        boxes = []
+        for feature, rings in enumerate(feature_rings):
+            if not rings:
+                continue
+            self.features.append(feature)
+            starts = np.concatenate([ring[:-1] for ring in rings])
+            ends = np.concatenate([ring[1:] for ring in rings])
+            self.edges.append((starts, ends))
+            points = np.concatenate(rings)
+            boxes.append((*points.min(axis=0), *points.max(axis=0)))
+        self.boxes = np.array(boxes).reshape(-1, 4)
+
+        self.grid_size = grid_size
+        self.origin = self.boxes[:, :2].min(axis=0, initial=np.inf)
+        extent = self.boxes[:, 2:].max(axis=0, initial=-np.inf) - self.origin
+        self.cell_size = np.where(extent > 0, extent, 1.0) / grid_size
+
+        self.cells = [[] for _ in range(grid_size * grid_size)]
+        for feature, box in enumerate(self.boxes):
+            (col0, row0), (col1, row1) = self._cell(box[:2]), self._cell(box[2:])
+            for row in range(row0, row1 + 1):
+                for col in range(col0, col1 + 1):
+                    self.cells[row * grid_size + col].append(feature)
+
+    def _cell(self, point):
+        cell = ((np.asarray(point) - self.origin) // self.cell_size).astype(int)
+        return np.clip(cell, 0, self.grid_size - 1)
+
+    def locate(self, lon, lat):
+        """Index of the feature containing the point, or None."""
+        point = np.array([lon, lat], dtype=float)
+        if not self.features or np.any(point < self.origin) or np.any(point > self.origin + self.cell_size * self.grid_size):
+            return None
+        col, row = self._cell(point)
+        for feature in self.cells[row * self.grid_size + col]:
+            min_lon, min_lat, max_lon, max_lat = self.boxes[feature]
+            if not (min_lon <= lon <= max_lon and min_lat <= lat <= max_lat):
+                continue
+            starts, ends = self.edges[feature]
+            # Edges straddling the point's latitude, crossed right of the point
+            straddle = (starts[:, 1] > lat) != (ends[:, 1] > lat)
+            a, b = starts[straddle], ends[straddle]
+            crossing = a[:, 0] + (lat - a[:, 1]) * (b[:, 0] - a[:, 0]) / (b[:, 1] - a[:, 1])
+            if np.count_nonzero(crossing > lon) % 2:
+                return self.features[feature]
+        return None
+
+
+def load_boundaries(path=BOUNDARY_FILE):
+    """Load the boundary cache, building it first if missing or stale.
+
+    Returns None when the boundary file is not available.
+    """
+    if not os.path.exists(path):
+        return None
+    cache_file = cache_path(path)
+    if os.path.exists(cache_file):
+        try:
+            boundaries = Boundaries(cache_file)
+        except (OSError, KeyError, ValueError, EOFError, zipfile.BadZipFile):
+            # Corrupt, truncated or from an older layout; rebuilt below
+            boundaries = None
+        if boundaries is not None and boundaries.version == data_version(path):
+            return boundaries
+    build_cache(path)
+    return Boundaries(cache_file)
+
+
+def pick_resolution(bounds, width_px=800):
+    # Coarsest resolution whose tolerance is still under one pixel
+    min_lon, min_lat, max_lon, max_lat = bounds
+    degrees_per_pixel = max(max_lon - min_lon, max_lat - min_lat) / width_px
+    for resolution, tolerance in reversed(RESOLUTIONS.items()):
+        if tolerance <= degrees_per_pixel:
+            return resolution
+    return next(iter(RESOLUTIONS))
@@ -0,0 +1,224 @@
+"""Chart builders shared by the dashboard pages and the report generator.
+
+Builders take already-filtered data and return Plotly figures; they do
+no caching and do not depend on Streamlit.
+"""
+import plotly.express as px
+import plotly.graph_objects as go
+
+from formatting import number, percent
+
+GENDER_COLORS = {
+    'Male': '#2E2E2E',
+    'Female': '#E5243B',
+    'Transgender': '#7a0000',
+    'Total': '#7a0000'
+}
+GENDER_LABELS = {'Male': 'Boys', 'Female': 'Girls'}
+AREA_COLORS = {
+    'Urban': '#7a0000',  # Dark red for urban
+    'Rural': '#E5243B'   # Light red for rural
+}
+
+
+def literacy_chart(literacy_data, indicator, genders):
+    fig_literacy = px.bar(
+        literacy_data,
+        x='Region',
+        y=list(genders),
+        barmode='group',
+        title=f'{indicator} by Gender and Region',
+        color_discrete_map=GENDER_COLORS,
+        labels={'value': indicator, 'variable': 'Gender'}
+    )
+
+    fig_literacy.update_layout(
+        font_family="Poppins",
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        xaxis_title="Region",
+        yaxis_title=indicator,
+        legend_title="Gender",
+        hoverlabel=dict(font_family="Poppins"),
+        title_font_family="Poppins"
+    )
+    return fig_literacy
+
+
+def oosc_chart(oosc_data, indicator, genders):
+    fig_oosc = go.Figure()
+
+    for gender in genders:
+        fig_oosc.add_trace(go.Bar(
+            y=oosc_data['Region'],
+            x=oosc_data[gender],
+            name=GENDER_LABELS.get(gender, gender),
+            orientation='h',
+            marker_color=GENDER_COLORS[gender]
+        ))
+
+    fig_oosc.update_layout(
+        barmode='stack',
+        title=f'{indicator} Distribution',
+        font_family="Poppins",
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        xaxis_title="Number of Children",
+        yaxis_title="Region",
+        hoverlabel=dict(font_family="Poppins"),
+        title_font_family="Poppins"
+    )
+    return fig_oosc
+
+
+def comparison_chart(urban_rural_data, indicator, value_column):
+    fig_comparison = px.bar(
+        urban_rural_data,
+        x='Region',
+        y=value_column,
+        color='AreaType',
+        barmode='group',
+        title=f'Urban vs Rural {indicator}',
+        color_discrete_sequence=['#2E2E2E', '#E5243B']
+    )
+
+    fig_comparison.update_layout(
+        font_family="Poppins",
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        xaxis_title="Region",
+        yaxis_title="Number of Children",
+        hoverlabel=dict(font_family="Poppins"),
+        title_font_family="Poppins"
+    )
+    return fig_comparison
+
+
+def area_breakdown(data, value_column):
+    """Urban/Rural rows per region with each row's share of its region.
+
+    ``data`` holds one row per (Region, AreaType); 'Total' rows are dropped.
+    Validated data has both area types for every region, zero-filled.
+    """
+    viz_data = data[data['AreaType'] != 'Total'].reset_index(drop=True)
+    shares = viz_data[value_column] / viz_data.groupby('Region')[value_column].transform('sum') * 100
+    return viz_data.assign(Percentage=shares.round(1))
+
+
+def hierarchy_treemap(view, title):
+    """Treemap of a HierarchyIndex view; leaves are coloured by area type."""
+    fig_treemap = go.Figure(go.Treemap(
+        ids=view['id'],
+        labels=view['label'],
+        parents=view['parent'],
+        values=view['value'],
+        branchvalues='total',
+        marker_colors=[AREA_COLORS.get(label, '#2E2E2E') for label in view['label']],
+        textinfo="label",
+        hovertemplate="""
+<b>%{label}</b><br>
+Number of children: %{value:,.0f}<br>
+Percentage: %{percentParent:.1%}<extra></extra>
+""",
+        textfont={"color": "white"}  # Make text white for better visibility
+    ))
+
+    fig_treemap.update_layout(
+        title={
+            'text': title,
+            'y':0.95,
+            'x':0.5,
+            'xanchor': 'center',
+            'yanchor': 'top'
+        },
+        height=600
+    )
+    return fig_treemap
+
+
+def never_attended_bar(viz_data, value_column):
+    fig_bar = go.Figure()
+
+    for area_type in ['Urban', 'Rural']:
+        area_data = viz_data[viz_data['AreaType'] == area_type]
+        fig_bar.add_trace(go.Bar(
+            name=area_type,
+            x=area_data['Region'],
+            y=area_data[value_column],
+            text=number(area_data[value_column]),
+            textposition='auto',
+            marker_color=AREA_COLORS[area_type],
+            hovertemplate='<b>%{x}</b><br>' +
+                        f'{area_type} Areas<br>' +
+                        'Children: %{text}<br>' +
+                        'Percentage: %{customdata}<extra></extra>',
+            customdata=percent(area_data['Percentage'])
+        ))
+
+    # Update layout
+    fig_bar.update_layout(
+        title={
+            'text': 'Urban vs Rural Distribution of Out-of-School Children',
+            'y':0.95,
+            'x':0.5,
+            'xanchor': 'center',
+            'yanchor': 'top'
+        },
+        xaxis_title="Region",
+        yaxis_title="Number of Children",
+        barmode='group',
+        bargap=0.2,
+        bargroupgap=0.1,
+        height=500,
+        showlegend=True,
+        legend=dict(
+            yanchor="top",
+            y=0.99,
+            xanchor="right",
+            x=0.99
+        ),
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+    )
+
+    # Update axes
+    fig_bar.update_xaxes(
+        tickangle=45,
+        title_font={"size": 14},
+        title_standoff=25,
+        gridcolor='#F0F0F0'
+    )
+
+    fig_bar.update_yaxes(
+        title_font={"size": 14},
+        title_standoff=25,
+        gridcolor='#F0F0F0',
+        zeroline=True,
+        zerolinecolor='#E0E0E0',
+        zerolinewidth=1
+    )
+    return fig_bar
+
+
+def choropleth_map(map_data, geojson, value_column, title):
+    fig_map = px.choropleth(
+        map_data,
+        geojson=geojson,
+        locations='Region',
+        featureidkey='properties.Region',
+        color=value_column,
+        hover_name='Region',
+        color_continuous_scale=['#FCE4E4', '#E5243B', '#7a0000']
+    )
+
+    fig_map.update_geos(fitbounds='locations', visible=False)
+    fig_map.update_layout(
+        title=title,
+        font_family="Poppins",
+        paper_bgcolor='rgba(0,0,0,0)',
+        hoverlabel=dict(font_family="Poppins"),
+        title_font_family="Poppins",
+        margin=dict(l=0, r=0, t=50, b=0),
+        height=500
+    )
+    return fig_map
@@ -0,0 +1,171 @@
+import glob
+import os
+import re
+
+import pandas as pd
+
+# One CSV per census release, e.g. data_2023.csv, kept next to this module
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_FILE_PATTERN = 'data_{year}.csv'
+DATA_FILE_REGEX = re.compile(r'data_(\d{4})\.csv')
+DISTRICT = 'Faisalabad District'
+KEY_COLUMNS = ['Region', 'AreaType', 'Indicator']
+VALUE_COLUMNS = ['Total', 'Male', 'Female', 'Transgender']
+AREA_TYPES = ['Total', 'Urban', 'Rural']
+# Male + Female + Transgender may differ from Total by a few people in
+# the published tables
+SUM_TOLERANCE = 10
+
+
+class DataValidationError(ValueError):
+    pass
+
+
+def available_years(directory=DATA_DIR):
+    years = []
+    for path in glob.glob(os.path.join(directory, DATA_FILE_PATTERN.format(year='*'))):
+        match = DATA_FILE_REGEX.fullmatch(os.path.basename(path))
+        if match:
+            years.append(int(match.group(1)))
+    return sorted(years)
+
+
+def year_path(year, directory=DATA_DIR):
+    return os.path.join(directory, DATA_FILE_PATTERN.format(year=year))
+
+
+def latest_year(directory=DATA_DIR):
+    # Looked up on every call, so a release added while the app runs is
+    # picked up on the next rerun
+    years = available_years(directory)
+    if not years:
+        raise FileNotFoundError(
+            f"No census data in {directory}: expected a {DATA_FILE_PATTERN.format(year='<year>')} file"
+        )
+    return years[-1]
+
+
+def data_file(directory=DATA_DIR):
+    return year_path(latest_year(directory), directory)
+
+
+def data_version(path=None):
+    # Cheap fingerprint of the data file, used to key caches so a new
+    # release of the CSV invalidates everything derived from it
+    path = data_file() if path is None else path
+    stat = os.stat(path)
+    name = os.path.splitext(os.path.basename(path))[0]
+    return f"{name}-{stat.st_mtime_ns:x}-{stat.st_size:x}"
+
+
+def is_rate(indicator):
+    return indicator.endswith('%')
+
+
+def is_count(indicator):
+    return not (is_rate(indicator) or indicator.startswith('Population'))
+
+
+def _rows(df, mask, limit=3):
+    rows = df.loc[mask, KEY_COLUMNS].drop_duplicates().head(limit)
+    return ', '.join('/'.join(row) for row in rows.itertuples(index=False))
+
+
+def validate(df):
+    """Check the invariants the dashboard reads without guarding.
+
+    Raises DataValidationError listing every broken check: unique
+    (Region, AreaType, Indicator) keys, known area types, a Total row for
+    every region and indicator, non-negative values, percentages of at
+    most 100 and gender columns that add up to Total for counts.
+    """
+    missing = [column for column in KEY_COLUMNS + VALUE_COLUMNS if column not in df.columns]
+    if missing:
+        raise DataValidationError(f"Missing columns: {', '.join(missing)}")
+
+    problems = []
+    duplicated = df.duplicated(KEY_COLUMNS, keep=False)
+    if duplicated.any():
+        problems.append(f"duplicate rows for {_rows(df, duplicated)}")
+
+    unknown = ~df['AreaType'].isin(AREA_TYPES)
+    if unknown.any():
+        problems.append(f"unknown area types in {_rows(df, unknown)}")
+
+    expected = pd.MultiIndex.from_product(
+        [df['Region'].unique(), df['Indicator'].unique()], names=['Region', 'Indicator']
+    )
+    present = pd.MultiIndex.from_frame(df.loc[df['AreaType'] == 'Total', ['Region', 'Indicator']])
+    absent = expected.difference(present)
+    if len(absent):
+        problems.append(f"no Total row for {', '.join('/'.join(key) for key in absent[:3])}")
+
+    values = df[VALUE_COLUMNS].apply(pd.to_numeric, errors='coerce')
+    invalid = values.isna().any(axis=1) | (values < 0).any(axis=1)
+    if invalid.any():
+        problems.append(f"missing or negative values in {_rows(df, invalid)}")
+
+    rates = df['Indicator'].map(is_rate).to_numpy(dtype=bool)
+    over = rates & (values > 100).any(axis=1)
+    if over.any():
+        problems.append(f"percentages above 100 in {_rows(df, over)}")
+
+    gender_sum = values[['Male', 'Female', 'Transgender']].sum(axis=1)
+    mismatch = ~rates & ((gender_sum - values['Total']).abs() > SUM_TOLERANCE)
+    if mismatch.any():
+        problems.append(f"Male + Female + Transgender differs from Total in {_rows(df, mismatch)}")
+
+    if problems:
+        raise DataValidationError('; '.join(problems))
+    df.attrs['validated'] = True
+    return df
+
+
+def normalise(df):
+    # Every region gets every (AreaType, Indicator) row, sorted by key. An
+    # area a region does not have (the city tehsil has no rural part) gets
+    # zero counts and no rates, so render paths never need to fill gaps.
+    # Only the cube is filled; read_data keeps the rows as published.
+    full = pd.MultiIndex.from_product(
+        [df['Region'].unique(), AREA_TYPES, df['Indicator'].unique()], names=KEY_COLUMNS
+    )
+    data = df.set_index(KEY_COLUMNS)[VALUE_COLUMNS].astype(float).reindex(full)
+    counts = ~data.index.get_level_values('Indicator').map(is_rate).to_numpy(dtype=bool)
+    data[counts] = data[counts].fillna(0)
+    return data.sort_index().reset_index()
+
+
+def read_data(path=None):
+    # Validated on ingest; callers cache the result per data version, so
+    # the checks run once per release of the file
+    return validate(pd.read_csv(data_file() if path is None else path))
+
+
+def build_cube(df):
+    # One row per (Region, AreaType, Indicator) on the full grid, sorted so
+    # that slicing on any prefix of the key is an index lookup, not a scan
+    if not df.attrs.get('validated'):
+        df = validate(df)
+    cube = normalise(df).set_index(KEY_COLUMNS)[VALUE_COLUMNS]
+    cube.attrs['validated'] = True
+    return cube
+
+
+def list_regions(cube):
+    # District first, tehsils after in alphabetical order
+    regions = cube.index.get_level_values('Region').unique().tolist()
+    return sorted(regions, key=lambda region: region != DISTRICT)
+
+
+def list_indicators(cube):
+    return cube.index.get_level_values('Indicator').unique().tolist()
+
+
+def slice_cube(cube, indicator, regions, area_types, genders):
+    # Rows of one indicator for the given regions and area types
+    data = cube.xs(indicator, level='Indicator')
+    mask = (
+        data.index.get_level_values('Region').isin(regions)
+        & data.index.get_level_values('AreaType').isin(area_types)
+    )
+    return data.loc[mask, list(genders)].reset_index()
@@ -0,0 +1,110 @@
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from education_data import DISTRICT, is_count
+from peers import region_level
+
+Equity = namedtuple('Equity', ['parity', 'dispersion'])
+
+GENDERS = ['Total', 'Male', 'Female']
+# Counts are compared per 100 people aged 5+, so large tehsils do not
+# look unequal just for being large; rates and populations are kept as is
+RATE_BASE = 'Population >=5'
+
+
+def default_parents(cube):
+    # The census tables name no parent, so every tehsil sits under the district
+    return {region: DISTRICT for region in cube.index.get_level_values('Region').unique()
+            if region != DISTRICT}
+
+
+def build_parity(cube):
+    """Gender and urban/rural parity for every (Region, Indicator) at once.
+
+    Parity indices are female/male and rural/urban; gaps are male minus
+    female and urban minus rural, in the indicator's own units.
+    """
+    totals = cube.xs('Total', level='AreaType')
+    urban = cube.xs('Urban', level='AreaType')['Total']
+    rural = cube.xs('Rural', level='AreaType')['Total']
+    # An area with nobody in it (the city tehsil has no rural part) has no parity
+    population = cube.xs(RATE_BASE, level='Indicator')['Total']
+    regions = urban.index.get_level_values('Region')
+    urban = urban.where(population.xs('Urban', level='AreaType').reindex(regions).to_numpy() > 0)
+    rural = rural.where(population.xs('Rural', level='AreaType').reindex(regions).to_numpy() > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        parity = pd.DataFrame({
+            'Gender parity index': totals['Female'] / totals['Male'],
+            'Gender gap': totals['Male'] - totals['Female'],
+            'Rural/urban parity index': rural / urban,
+            'Urban-rural gap': urban - rural,
+        })
+    return parity.replace([np.inf, -np.inf], np.nan)
+
+
+def _member_groups(regions, parents):
+    # (group, region) pairs: every region belongs to its parent, and to its
+    # level as a whole (e.g. 'All Tehsils') when that spans several parents
+    pairs = [(parents[region], region) for region in regions if region in parents]
+    by_level = {}
+    for region in regions:
+        by_level.setdefault(region_level(region), []).append(region)
+    for level, members in by_level.items():
+        if len({parents.get(region) for region in members}) > 1 or not any(r in parents for r in members):
+            pairs += [(f"All {level}s", region) for region in members]
+    return pd.DataFrame(pairs, columns=['Group', 'Region'])
+
+
+def build_dispersion(cube, parents=None):
+    """Gini, Theil and coefficient of variation across each group's members.
+
+    Groups are every parent region (its tehsils) and every level of the
+    hierarchy; all groups, indicators and genders are computed together
+    as grouped array operations over one long table.
+    """
+    parents = default_parents(cube) if parents is None else parents
+    data = cube.xs('Total', level='AreaType')[GENDERS]
+
+    # Counts per 100 aged 5+, gender by gender
+    base = data.xs(RATE_BASE, level='Indicator')
+    counts = data.index.get_level_values('Indicator').map(is_count).to_numpy(dtype=bool)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rates = data.div(base, level='Region') * 100
+    data = pd.DataFrame(np.where(counts[:, None], rates, data), index=data.index, columns=GENDERS)
+
+    long = data.stack().reset_index()
+    long.columns = ['Region', 'Indicator', 'Gender', 'Value']
+    members = _member_groups(data.index.get_level_values('Region').unique(), parents)
+    long = members.merge(long, on='Region').dropna(subset=['Value'])
+
+    keys = ['Group', 'Indicator', 'Gender']
+    long = long.sort_values(keys + ['Value'])
+    grouped = long.groupby(keys, sort=False)['Value']
+    n = grouped.transform('size')
+    mean = grouped.transform('mean')
+
+    # Gini from sorted values: sum((2i - n - 1) x_i) / (n^2 mean)
+    rank = long.groupby(keys, sort=False).cumcount() + 1
+    long['gini'] = (2 * rank - n - 1) * long['Value'] / (n * n * mean)
+    ratio = long['Value'] / mean
+    with np.errstate(divide='ignore', invalid='ignore'):
+        long['theil'] = np.where(ratio > 0, ratio * np.log(ratio), 0) / n
+
+    sums = long.groupby(keys, sort=False)[['gini', 'theil']].sum()
+    stats = grouped.agg(['size', 'mean'])
+    stats['std'] = grouped.std(ddof=0)
+    dispersion = pd.DataFrame({
+        'Members': stats['size'],
+        'Mean': stats['mean'],
+        'Gini': sums['gini'],
+        'Theil': sums['theil'],
+        'Coefficient of variation': stats['std'] / stats['mean'],
+    })
+    dispersion = dispersion[dispersion['Members'] > 1]
+    return dispersion.replace([np.inf, -np.inf], np.nan).sort_index()
+
+
+def build_equity(cube, parents=None):
+    return Equity(build_parity(cube), build_dispersion(cube, parents))
@@ -0,0 +1,178 @@
+import inspect
+from collections import namedtuple
+
+import streamlit as st
+
+from education_data import (
+    DISTRICT,
+    build_cube,
+    data_version,
+    list_indicators,
+    list_regions,
+    read_data,
+)
+from equity import build_equity
+from formatting import build_labels
+from search import SearchIndex
+
+# A sidebar selection. Every field is a plain string or tuple of strings
+# so selections hash cheaply and can key the memoised stages below.
+Selection = namedtuple('Selection', ['indicator', 'regions', 'area_types', 'genders'])
+
+GENDER_OPTIONS = ['All', 'Male', 'Female', 'Transgender']
+# Chart selection events need a newer Streamlit; pages fall back to
+# plain widgets for drill-down on older versions
+SUPPORTS_SELECTION = 'on_select' in inspect.signature(st.plotly_chart).parameters
+rerun = getattr(st, 'rerun', None) or st.experimental_rerun
+
+# Session key of the region picked on a map, shared by every page
+FOCUS_KEY = 'focus_region'
+
+
+@st.cache_resource(max_entries=4)
+def load_cube(version, path=None):
+    # Keyed on the data version, so each census year is loaded only when
+    # a page asks for it and reloaded when its file changes
+    return build_cube(read_data(path))
+
+
+@st.cache_resource(max_entries=2)
+def load_search_index(version):
+    cube = load_cube(version)
+    return SearchIndex(
+        [(region, 'Region') for region in list_regions(cube)]
+        + [(indicator, 'Indicator') for indicator in list_indicators(cube)]
+    )
+
+
+@st.cache_resource(max_entries=4)
+def load_labels(version):
+    # Display strings for every cube cell, formatted once per version
+    return build_labels(load_cube(version))
+
+
+@st.cache_resource(max_entries=4)
+def load_equity(version):
+    # Parity and dispersion for every region and indicator, once per version
+    return build_equity(load_cube(version))
+
+
+# Selections are answered in stages: indicator -> area type -> region ->
+# gender. Each stage is memoised on its own inputs (most recent entries
+# kept), so changing one filter only recomputes the stages after it.
+@st.cache_resource(max_entries=16)
+def _slice_indicator(version, indicator):
+    return load_cube(version).xs(indicator, level='Indicator')
+
+
+@st.cache_resource(max_entries=64)
+def _slice_area_types(version, indicator, area_types):
+    data = _slice_indicator(version, indicator)
+    return data[data.index.get_level_values('AreaType').isin(area_types)]
+
+
+@st.cache_resource(max_entries=64)
+def _slice_regions(version, indicator, area_types, regions):
+    data = _slice_area_types(version, indicator, area_types)
+    return data[data.index.get_level_values('Region').isin(regions)]
+
+
+@st.cache_resource(max_entries=128)
+def select(version, selection):
+    data = _slice_regions(
+        version, selection.indicator, selection.area_types, selection.regions
+    )
+    return data[list(selection.genders)].reset_index()
+
+
+def focus_region(region):
+    """Narrow the tehsil filter to ``region`` on this and every other page."""
+    st.session_state[FOCUS_KEY] = region
+    # Drop the widget's own state so its next run starts from the focus
+    st.session_state.pop('filter_regions', None)
+
+
+def _clear_focus():
+    st.session_state.pop(FOCUS_KEY, None)
+
+
+def _apply_suggestion(suggestion):
+    # Runs as a callback, before the filter widgets are created
+    if suggestion.kind == 'Region':
+        focus_region(suggestion.label)
+    else:
+        st.session_state['filter_indicator'] = suggestion.label
+    st.session_state['filter_search'] = ''
+
+
+def _search_box(version, indicators):
+    query = st.sidebar.text_input(
+        "Search", key='filter_search', placeholder="Tehsil or indicator, e.g. jaranwala"
+    )
+    if not query:
+        return
+    suggestions = [
+        suggestion for suggestion in load_search_index(version).suggest(query)
+        if suggestion.kind == 'Region' or suggestion.label in indicators
+    ]
+    if not suggestions:
+        st.sidebar.caption("No matches")
+    for i, suggestion in enumerate(suggestions):
+        st.sidebar.button(
+            f"{suggestion.label} · {suggestion.kind}",
+            key=f'filter_search_{i}',
+            on_click=_apply_suggestion,
+            args=(suggestion,)
+        )
+
+
+def value_column(selection):
+    # Column for charts that show one value per row: the chosen gender,
+    # or everyone when the selection spans several genders
+    return selection.genders[0] if len(selection.genders) == 1 else 'Total'
+
+
+def sidebar_filters(indicator, area_types=('Urban', 'Rural'),
+                    genders=('Male', 'Female'), include_district=True, indicators=None):
+    """Render the shared sidebar filters and return (version, selection).
+
+    The arguments are the page's defaults. ``genders`` is also what the
+    'All' gender option expands to on that page. ``indicators`` is a
+    predicate, such as ``is_count``, limiting the indicators offered to
+    those the page's charts can show.
+    """
+    version = data_version()
+    cube = load_cube(version)
+    regions = list_regions(cube)
+    default_regions = regions if include_district else [r for r in regions if r != DISTRICT]
+    if st.session_state.get(FOCUS_KEY) in regions:
+        default_regions = [st.session_state[FOCUS_KEY]]
+
+    indicator_options = [i for i in list_indicators(cube) if indicators is None or indicators(i)]
+    # An indicator picked on another page may not be offered on this one
+    if st.session_state.get('filter_indicator') not in indicator_options:
+        st.session_state.pop('filter_indicator', None)
+
+    st.sidebar.header("Filters")
+    _search_box(version, indicator_options)
+    chosen_indicator = st.sidebar.selectbox(
+        "Indicator",
+        indicator_options,
+        index=indicator_options.index(indicator),
+        key='filter_indicator'
+    )
+    chosen_regions = st.sidebar.multiselect(
+        "Tehsil", regions, default=default_regions, key='filter_regions', on_change=_clear_focus
+    )
+    chosen_area_types = st.sidebar.multiselect(
+        "Area Type", ['Urban', 'Rural', 'Total'], default=list(area_types), key='filter_area_types'
+    )
+    chosen_gender = st.sidebar.radio("Gender", GENDER_OPTIONS, key='filter_gender')
+
+    selection = Selection(
+        indicator=chosen_indicator,
+        regions=tuple(chosen_regions),
+        area_types=tuple(chosen_area_types),
+        genders=tuple(genders) if chosen_gender == 'All' else (chosen_gender,)
+    )
+    return version, selection
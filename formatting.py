@@ -0,0 +1,73 @@
+"""Number formatting for metric cards, chart labels and tables.
+
+Formatters take a scalar or a whole column and return a string or an
+object array ready for Plotly ``text``/``customdata``. Scales and
+suffixes are picked with array operations and each column is formatted
+in a single pass; ``build_labels`` formats a whole cube once per data
+version so render paths only look labels up.
+"""
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from education_data import is_rate
+
+# Compact card values, largest scale first: 1.2M, 345.6K, 512
+SCALES = [(1_000_000, 'M'), (1_000, 'K')]
+
+Labels = namedtuple('Labels', ['number', 'compact'])
+
+
+def _format(template, values, na_rep, *extra):
+    values = np.asarray(values, dtype=float)
+    scalar = values.ndim == 0
+    values = np.atleast_1d(values)
+    text = np.array(list(map(template.format, values.tolist(), *extra)), dtype=object)
+    text[np.isnan(values)] = na_rep
+    return text[0] if scalar else text
+
+
+def number(values, decimals=0, na_rep=''):
+    """Thousands-separated numbers, e.g. 1,234,567 or 12,345.6."""
+    return _format(f'{{:,.{decimals}f}}', values, na_rep)
+
+
+def percent(values, decimals=1, na_rep=''):
+    """Percentages already on a 0-100 scale, e.g. 72.3%."""
+    return _format(f'{{:.{decimals}f}}%', values, na_rep)
+
+
+def compact(values, na_rep=''):
+    """Short card values: 1.2M, 345.6K, or the whole number below 1,000."""
+    values = np.asarray(values, dtype=float)
+    magnitude = np.abs(np.nan_to_num(values))
+    # np.select takes the first scale that applies; compare the rounded
+    # value so 999,960 reads 1.0M rather than 1000.0K
+    conditions = [np.round(magnitude / scale, 1) >= 1 for scale, _ in SCALES]
+    scale = np.select(conditions, [scale for scale, _ in SCALES], 1)
+    suffix = np.select(conditions, [suffix for _, suffix in SCALES], '')
+    decimals = np.where(scale > 1, 1, 0)
+    text = _format('{:.{}f}{}', values / scale, na_rep, np.atleast_1d(decimals).tolist(),
+                   np.atleast_1d(suffix).tolist())
+    return text
+
+
+def build_labels(cube):
+    """Display strings for every cube cell, in the cube's own shape.
+
+    Rates are shown as percentages in both styles; counts as full
+    thousands-separated numbers (``number``) or card values (``compact``).
+    """
+    rates = np.repeat(
+        cube.index.get_level_values('Indicator').map(is_rate).to_numpy(dtype=bool),
+        len(cube.columns)
+    )
+    values = cube.to_numpy(dtype=float).ravel()
+    rate_text = percent(values[rates])
+
+    def frame(text):
+        text[rates] = rate_text
+        return pd.DataFrame(text.reshape(cube.shape), index=cube.index, columns=cube.columns)
+
+    return Labels(frame(number(values)), frame(compact(values)))
@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+
+
+class HierarchyIndex:
+    """Subtree totals of a labelled hierarchy, served a few levels at a time.
+
+    ``leaves`` has one row per leaf with a column per level (outermost
+    first, e.g. Region then AreaType) plus value columns. Totals for every
+    node are aggregated once, level by level and split by the label of
+    the innermost level, so showing any part of the tree, for any subset
+    of labels, only reads the nodes in view.
+    """
+
+    def __init__(self, leaves, levels, value_columns, root):
+        self.root = root
+        self.levels = list(levels)
+        self.value_columns = list(value_columns)
+        self.labels = {root: root}
+        self.parents = {root: ''}
+        self.children = {root: []}
+        self.depths = {root: 0}
+
+        # (leaf, innermost label, value) contributions, so a node's total
+        # for any set of innermost labels is a sum over one small axis
+        categories = pd.Categorical(leaves[self.levels[-1]])
+        self.categories = np.asarray(categories.categories)
+        contributions = np.zeros((len(leaves), len(self.categories), len(self.value_columns)))
+        contributions[np.arange(len(leaves)), categories.codes] = leaves[self.value_columns].to_numpy(dtype=float)
+        self.totals = {root: contributions.sum(axis=0)}
+
+        for depth in range(1, len(self.levels) + 1):
+            codes = leaves.groupby(self.levels[:depth], sort=False).ngroup().to_numpy()
+            _, first = np.unique(codes, return_index=True)
+            sums = np.zeros((len(first),) + contributions.shape[1:])
+            np.add.at(sums, codes, contributions)
+            keys = leaves[self.levels[:depth]].iloc[first].itertuples(index=False, name=None)
+            for key, values in zip(keys, sums):
+                node, parent = self.node_id(key), self.node_id(key[:-1])
+                self.labels[node] = key[-1]
+                self.parents[node] = parent
+                self.depths[node] = depth
+                self.totals[node] = values
+                self.children[node] = []
+                self.children[parent].append(node)
+
+        # Largest children first, so views list them in display order
+        for kids in self.children.values():
+            kids.sort(key=lambda node: -self.totals[node][:, 0].sum())
+
+    def node_id(self, key):
+        return '/'.join((self.root,) + tuple(key))
+
+    def view(self, node, depth=1, value_column=None, keep=None):
+        """The node and up to ``depth`` levels below it, as Treemap columns.
+
+        ``keep`` maps level names to the labels shown at that level, e.g.
+        ``{'Region': [...], 'AreaType': ['Urban']}``; totals then count only
+        the leaves under kept labels.
+        """
+        column = self.value_columns.index(value_column or self.value_columns[0])
+        keep = self._depth_labels(keep)
+        innermost = keep.pop(len(self.levels), None)
+        shown = np.ones(len(self.categories), dtype=bool) if innermost is None else np.isin(
+            self.categories, list(innermost)
+        )
+        # Above the deepest filtered outer level, a total is the sum of the
+        # kept children; from there down the stored split answers it
+        deepest = max(keep, default=0)
+
+        def kept(current):
+            depth = self.depths[current]
+            if depth == len(self.levels):
+                return innermost is None or self.labels[current] in innermost
+            return depth not in keep or self.labels[current] in keep[depth]
+
+        def total(current):
+            if self.depths[current] >= deepest:
+                return self.totals[current][shown, column].sum()
+            return sum(total(child) for child in self.children[current] if kept(child))
+
+        rows = []
+        level = [node]
+        for current_depth in range(depth + 1):
+            for current in level:
+                rows.append((
+                    current,
+                    self.labels[current],
+                    self.parents[current] if current_depth else '',
+                    total(current),
+                    any(kept(child) for child in self.children[current]),
+                ))
+            level = [child for current in level for child in self.children[current] if kept(child)]
+        return pd.DataFrame(rows, columns=['id', 'label', 'parent', 'value', 'has_children'])
+
+    def contains(self, node, keep=None):
+        """Whether ``node`` and its ancestors are all kept by ``keep``."""
+        if node not in self.labels:
+            return False
+        keep = self._depth_labels(keep)
+        while node != self.root:
+            depth = self.depths[node]
+            if depth in keep and self.labels[node] not in keep[depth]:
+                return False
+            node = self.parents[node]
+        return True
+
+    def _depth_labels(self, keep):
+        # {level name: labels} -> {node depth: set of labels}
+        return {self.levels.index(level) + 1: set(labels) for level, labels in (keep or {}).items()}
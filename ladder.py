@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+
+from education_data import VALUE_COLUMNS
+
+# Education ladder, lowest stage first
+LADDER_STAGES = [
+    'Ever Attended',
+    'Enrolment Primary',
+    'Primary Completed',
+    'Enrolment Middle',
+    'Enrolment Matric',
+    'Enrolment Intermidiate',
+    'Enrolment Graduation above',
+]
+STAGE_LABELS = {
+    'Ever Attended': 'Ever Attended',
+    'Enrolment Primary': 'Primary',
+    'Primary Completed': 'Primary Completed',
+    'Enrolment Middle': 'Middle',
+    'Enrolment Matric': 'Matric',
+    'Enrolment Intermidiate': 'Intermediate',
+    'Enrolment Graduation above': 'Graduation+',
+}
+TRANSITIONS = [
+    f"{STAGE_LABELS[lower]} → {STAGE_LABELS[upper]}"
+    for lower, upper in zip(LADDER_STAGES, LADDER_STAGES[1:])
+]
+
+
+def build_ladder(cube):
+    """Stage counts and stage-to-stage ratios for every region at once.
+
+    Returns ``(counts, ratios)``. Both are indexed by (Region, AreaType)
+    with (gender, stage) columns; a ratio is the count at a stage divided
+    by the count at the stage below it, NaN where the lower stage is 0.
+    """
+    ladder = cube[cube.index.get_level_values('Indicator').isin(LADDER_STAGES)]
+    counts = ladder.unstack('Indicator')
+    counts = counts.reindex(
+        columns=pd.MultiIndex.from_product([VALUE_COLUMNS, LADDER_STAGES])
+    )
+
+    # (rows, genders, stages) so every ratio is one array division
+    values = counts.to_numpy(dtype=float).reshape(len(counts), len(VALUE_COLUMNS), len(LADDER_STAGES))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratios = values[:, :, 1:] / values[:, :, :-1]
+    ratios[~np.isfinite(ratios)] = np.nan
+
+    ratios = pd.DataFrame(
+        ratios.reshape(len(counts), -1),
+        index=counts.index,
+        columns=pd.MultiIndex.from_product([VALUE_COLUMNS, TRANSITIONS])
+    )
+    counts.columns = pd.MultiIndex.from_product([VALUE_COLUMNS, [STAGE_LABELS[s] for s in LADDER_STAGES]])
+    return counts, ratios
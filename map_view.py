@@ -0,0 +1,129 @@
+import os
+
+import streamlit as st
+
+from boundaries import BOUNDARY_FILE, load_boundaries, pick_resolution
+from charts import choropleth_map
+from education_data import data_version
+from filters import (
+    FOCUS_KEY,
+    SUPPORTS_SELECTION,
+    focus_region,
+    rerun,
+    select,
+    value_column,
+)
+
+
+@st.cache_resource(max_entries=2)
+def _load_boundaries(boundary_version):
+    return load_boundaries()
+
+
+@st.cache_resource(max_entries=32)
+def build_region_map(version, boundary_version, selection, column, resolution):
+    boundaries = _load_boundaries(boundary_version)
+    map_data = select(version, selection._replace(area_types=('Total',), genders=(column,)))
+    return choropleth_map(
+        map_data,
+        boundaries.geojson(resolution),
+        column,
+        f'{selection.indicator} by Tehsil'
+    )
+
+
+def _query_location():
+    # ?lon=..&lat=.. links from other maps; values are lists on old Streamlit
+    params = st.query_params if hasattr(st, 'query_params') else st.experimental_get_query_params()
+    try:
+        lon, lat = (params[name] for name in ('lon', 'lat'))
+        lon, lat = (value[0] if isinstance(value, list) else value for value in (lon, lat))
+        return float(lon), float(lat)
+    except (KeyError, IndexError, ValueError):
+        return None
+
+
+def _clear_query_location():
+    if hasattr(st, 'query_params'):
+        for name in ('lon', 'lat'):
+            st.query_params.pop(name, None)
+    else:
+        params = st.experimental_get_query_params()
+        st.experimental_set_query_params(
+            **{name: value for name, value in params.items() if name not in ('lon', 'lat')}
+        )
+
+
+def _drill_down(region):
+    if region != st.session_state.get(FOCUS_KEY):
+        focus_region(region)
+        rerun()
+
+
+def _locate(boundaries, lon, lat):
+    region = boundaries.locate(lon, lat)
+    if region is None:
+        st.warning(f"({lon:.4f}, {lat:.4f}) is outside the mapped tehsils.")
+    else:
+        _drill_down(region)
+
+
+def render_region_map(version, selection):
+    """Choropleth of the selected indicator for the selected tehsils.
+
+    Clicking a tehsil, or locating a coordinate inside one, narrows the
+    tehsil filter on every page to that tehsil.
+    """
+    if not os.path.exists(BOUNDARY_FILE):
+        st.info(f"Tehsil maps appear here once `{BOUNDARY_FILE}` is added next to the data.")
+        return
+
+    boundary_version = data_version(BOUNDARY_FILE)
+    boundaries = _load_boundaries(boundary_version)
+
+    location = _query_location()
+    if location is not None:
+        _clear_query_location()
+        _locate(boundaries, *location)
+
+    regions = [region for region in selection.regions if region in boundaries.regions]
+    if not regions:
+        st.info("No tehsil boundaries for the selected regions.")
+        return
+
+    # Only ship as much detail as the zoomed-to area can show
+    bounds = boundaries.bounds(regions)
+    resolution = pick_resolution(bounds)
+    fig_map = build_region_map(
+        version,
+        boundary_version,
+        selection._replace(regions=tuple(regions)),
+        value_column(selection),
+        resolution
+    )
+
+    if SUPPORTS_SELECTION:
+        # Keyed on the regions shown so a new view starts with no selection
+        event = st.plotly_chart(
+            fig_map,
+            use_container_width=True,
+            on_select='rerun',
+            selection_mode='points',
+            key='region_map-' + '|'.join(regions)
+        )
+        for point in event.selection.points if event else []:
+            if point.get('location'):
+                _drill_down(point['location'])
+            elif 'lon' in point and 'lat' in point:
+                _locate(boundaries, point['lon'], point['lat'])
+    else:
+        st.plotly_chart(fig_map, use_container_width=True)
+
+    with st.expander("Find a tehsil by coordinates"):
+        with st.form(key='locate_form'):
+            min_lon, min_lat, max_lon, max_lat = bounds
+            col1, col2 = st.columns(2)
+            lon = col1.number_input("Longitude", value=float(min_lon + max_lon) / 2, format="%.5f")
+            lat = col2.number_input("Latitude", value=float(min_lat + max_lat) / 2, format="%.5f")
+            if st.form_submit_button("Show this tehsil"):
+                _locate(boundaries, lon, lat)
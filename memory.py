@@ -0,0 +1,222 @@
+"""Memory accounting for the dashboard worker.
+
+Off by default. Each page calls ``track_page(__file__)`` first and
+``finish_page()`` last; with ``EDU_MEMORY_TRACKING=1`` allocations are
+traced with tracemalloc (this slows the app down noticeably) and:
+
+* per page, a tracemalloc snapshot counts the live memory allocated by
+  code running under that page file (its frames, caches and figures);
+* per session, the growth in traced memory over each run is summed.
+  Runs overlap between sessions, so this is an estimate.
+
+Totals are served as JSON on ``http://127.0.0.1:$EDU_HEALTH_PORT/health``
+(default 8503). When ``EDU_MEMORY_BUDGET_MB`` is set and the worker's
+resident memory passes it, ``st.cache_data`` and then
+``st.cache_resource`` are cleared; this works with tracing off too.
+Resident memory seldom shrinks after a clear, so caches are cleared
+once and not again until usage drops below ``REARM_FRACTION`` of the
+budget or ``EVICTION_COOLDOWN`` seconds have passed.
+"""
+import gc
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+TRACKING = os.environ.get('EDU_MEMORY_TRACKING', '0') not in ('', '0')
+MEMORY_BUDGET_MB = float(os.environ.get('EDU_MEMORY_BUDGET_MB', '0'))
+ENABLED = TRACKING or MEMORY_BUDGET_MB > 0
+HEALTH_PORT = int(os.environ.get('EDU_HEALTH_PORT', '8503'))
+# Frames kept per allocation; deep enough to reach the page file
+# from inside pandas and plotly
+TRACE_FRAMES = 32
+# Sessions not seen for this many seconds are dropped from the report
+SESSION_TTL = 3600
+# After clearing caches, wait for usage to fall below this share of the
+# budget, or for the cooldown to pass, before clearing them again
+REARM_FRACTION = 0.8
+EVICTION_COOLDOWN = 600
+
+logger = logging.getLogger(__name__)
+
+
+def resident_memory():
+    # Current resident set size on Linux, None where /proc is missing
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        return None
+
+
+class MemoryAccount:
+    def __init__(self, budget=0, evictors=(), trace=True):
+        self.budget = budget
+        # Called in order while over budget, e.g. clearing one cache
+        self.evictors = list(evictors)
+        self.evictions = 0
+        self._evicted_at = None
+        self.sessions = {}
+        self.pages = {}
+        self._runs = {}
+        self._lock = threading.Lock()
+        if trace and not tracemalloc.is_tracing():
+            tracemalloc.start(TRACE_FRAMES)
+
+    def begin(self, session, page):
+        traced = tracemalloc.get_traced_memory()[0]
+        with self._lock:
+            # A run cut short by st.stop or a rerun ends where the next one starts
+            self._close(session, traced)
+            self._runs[session] = (page, traced)
+            self.pages[page] = self.pages.get(page, 0) + 1
+        self.enforce_budget()
+
+    def finish(self, session):
+        traced = tracemalloc.get_traced_memory()[0]
+        with self._lock:
+            self._close(session, traced)
+        self.enforce_budget()
+
+    def _close(self, session, traced):
+        run = self._runs.pop(session, None)
+        if run is None:
+            return
+        page, start = run
+        stats = self.sessions.setdefault(session, {'runs': 0, 'growth': 0})
+        stats['page'] = page
+        stats['runs'] += 1
+        stats['growth'] += traced - start
+        stats['last_seen'] = time.time()
+
+    def usage(self):
+        resident = resident_memory()
+        return resident if resident is not None else tracemalloc.get_traced_memory()[0]
+
+    def enforce_budget(self):
+        if not self.budget:
+            return
+        with self._lock:
+            usage = self.usage()
+            if self._evicted_at is not None:
+                cooled_down = time.monotonic() - self._evicted_at >= EVICTION_COOLDOWN
+                if usage >= self.budget * REARM_FRACTION and not cooled_down:
+                    return
+                self._evicted_at = None
+            if usage <= self.budget:
+                return
+            self._evicted_at = time.monotonic()
+        for evict in self.evictors:
+            evict()
+            gc.collect()
+            self.evictions += 1
+            if self.usage() <= self.budget:
+                break
+
+    def page_usage(self):
+        # Live traced bytes whose allocation traceback passes through each page
+        if not tracemalloc.is_tracing():
+            return {}
+        snapshot = tracemalloc.take_snapshot()
+        usage = {}
+        for page in list(self.pages):
+            traces = snapshot.filter_traces([tracemalloc.Filter(True, page, all_frames=True)])
+            usage[page] = sum(stat.size for stat in traces.statistics('filename'))
+        return usage
+
+    def report(self):
+        traced, peak = tracemalloc.get_traced_memory()
+        page_usage = self.page_usage()
+        with self._lock:
+            cutoff = time.time() - SESSION_TTL
+            for session in [s for s, stats in self.sessions.items() if stats['last_seen'] < cutoff]:
+                del self.sessions[session]
+            return {
+                'resident_bytes': resident_memory(),
+                'traced_bytes': traced,
+                'traced_peak_bytes': peak,
+                'budget_bytes': self.budget or None,
+                'evictions': self.evictions,
+                'pages': {
+                    os.path.basename(page): {'runs': runs, 'live_bytes': page_usage.get(page, 0)}
+                    for page, runs in self.pages.items()
+                },
+                'sessions': {session: dict(stats) for session, stats in self.sessions.items()},
+            }
+
+
+class HealthHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    account = None
+
+    def do_GET(self):
+        if self.path.split('?', 1)[0] != '/health':
+            status, payload = 404, {'error': f"Unknown endpoint: {self.path}"}
+        else:
+            status, payload = 200, {'status': 'ok', 'memory': self.account.report()}
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _start_health_server(account, port):
+    HealthHandler.account = account
+    try:
+        server = ThreadingHTTPServer(('127.0.0.1', port), HealthHandler)
+    except OSError as e:
+        # Another worker (or anything else) holds the port; keep
+        # accounting without the endpoint
+        logger.warning("Memory health endpoint disabled, cannot bind port %s: %s", port, e)
+        return None
+    threading.Thread(target=server.serve_forever, name='health', daemon=True).start()
+    return server
+
+
+# One account and health server per worker process. Kept outside
+# st.cache_resource, which the account itself may clear.
+_account = None
+_account_lock = threading.Lock()
+
+
+def memory_account():
+    global _account
+    with _account_lock:
+        if _account is None:
+            _account = MemoryAccount(
+                int(MEMORY_BUDGET_MB * 2 ** 20),
+                evictors=[st.cache_data.clear, st.cache_resource.clear],
+                trace=TRACKING,
+            )
+            if HEALTH_PORT:
+                _start_health_server(_account, HEALTH_PORT)
+        return _account
+
+
+def _session_id():
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else None
+
+
+def track_page(page):
+    session = _session_id()
+    if ENABLED and session is not None:
+        memory_account().begin(session, os.path.abspath(page))
+
+
+def finish_page():
+    session = _session_id()
+    if ENABLED and session is not None:
+        memory_account().finish(session)
@@ -0,0 +1,57 @@
+from collections import OrderedDict
+
+import numpy as np
+
+
+class PagedTable:
+    """A table served one page at a time from presorted row orders.
+
+    Every display column is argsorted once up front. A (sort, filter)
+    combination resolves to an array of row positions, cached for recent
+    combinations, so turning pages only slices that array and copies the
+    rows on the page. ``formats`` maps columns to a formatting function
+    (see formatting.py); those columns are formatted once for display
+    while sorting still uses their numbers.
+    """
+
+    def __init__(self, df, formats=None, max_cached_orders=32):
+        self.df = df.reset_index(drop=True)
+        self.columns = list(self.df.columns)
+        self.display = self.df.assign(**{
+            column: format_column(self.df[column].to_numpy())
+            for column, format_column in (formats or {}).items()
+        })
+        self._orders = {
+            column: np.argsort(self.df[column].to_numpy(), kind='stable')
+            for column in self.columns
+        }
+        # Lower-cased text of every row, searched by the substring filter
+        text_columns = [c for c in self.columns if self.df[c].dtype == object]
+        self._text = self.df[text_columns].astype(str).agg(' '.join, axis=1).str.lower()
+        self._cache = OrderedDict()
+        self._max_cached_orders = max_cached_orders
+
+    def order(self, sort_column, ascending=True, query=''):
+        """Row positions matching ``query`` in sort order."""
+        key = (sort_column, ascending, query.strip().lower())
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        order = self._orders[sort_column]
+        if not ascending:
+            order = order[::-1]
+        if key[2]:
+            matches = self._text.str.contains(key[2], regex=False).to_numpy()
+            order = order[matches[order]]
+
+        self._cache[key] = order
+        if len(self._cache) > self._max_cached_orders:
+            self._cache.popitem(last=False)
+        return order
+
+    def page(self, page, page_size, sort_column, ascending=True, query=''):
+        """``(rows, total)``: the rows on a zero-based page and the match count."""
+        order = self.order(sort_column, ascending, query)
+        start = page * page_size
+        return self.display.iloc[order[start:start + page_size]], len(order)
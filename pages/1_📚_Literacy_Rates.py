@@ -1,6 +1,11 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
+
+from charts import literacy_chart
+from education_data import DISTRICT, data_version
+from filters import load_equity, load_labels, select, sidebar_filters
+from formatting import percent
+from map_view import render_region_map
+from memory import finish_page, track_page
 
 # Set page config
 st.set_page_config(
@@ -8,6 +13,7 @@ st.set_page_config(
     page_icon="📚",
     layout="wide"
 )
+track_page(__file__)
 
 # Custom CSS
 st.markdown("""
@@ -47,48 +53,12 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Load data with caching
-@st.cache_data(ttl=3600)  # Cache for 1 hour
-def load_data():
-    df = pd.read_csv('data_2023.csv')
-    # Pre-calculate common filters
-    df['is_literacy'] = df['Indicator'] == 'Literate %'
-    return df
-
-df = load_data()
-
-# Pre-filter data for visualizations
-@st.cache_data
-def prepare_visualization_data(df):
-    literacy_data = df[
-        (df['is_literacy']) & 
-        (df['AreaType'].isin(['Rural', 'Urban']))
-    ].copy()
-    return literacy_data
-
-# Calculate statistics with caching
-@st.cache_data
-def calculate_statistics(df):
-    urban_literacy = df[
-        (df['is_literacy']) & 
-        (df['AreaType'] == 'Urban') & 
-        (df['Region'] == 'Faisalabad District')
-    ]['Total'].values[0]
-
-    rural_literacy = df[
-        (df['is_literacy']) & 
-        (df['AreaType'] == 'Rural') & 
-        (df['Region'] == 'Faisalabad District')
-    ]['Total'].values[0]
-
-    gender_gap = df[
-        (df['is_literacy']) & 
-        (df['AreaType'] == 'Total') & 
-        (df['Region'] == 'Faisalabad District')
-    ]
-    male_female_gap = float(gender_gap['Male'].values[0]) - float(gender_gap['Female'].values[0])
-    
-    return urban_literacy, rural_literacy, male_female_gap
+# Build the literacy chart for a sidebar selection. Recent selections
+# and their figures are kept, so switching back to one is instant.
+@st.cache_resource(max_entries=32)
+def build_literacy_chart(version, selection):
+    literacy_data = select(version, selection)
+    return literacy_chart(literacy_data, selection.indicator, selection.genders)
 
 # Page title
 st.title("📚 Literacy Rate Analysis")
@@ -105,13 +75,16 @@ st.markdown("""
 # Key Statistics
 col1, col2, col3 = st.columns(3)
 
-# Calculate statistics
-urban_literacy, rural_literacy, male_female_gap = calculate_statistics(df)
+# Calculate statistics; the data is validated on load, so these rows exist
+version = data_version()
+district_literacy = load_labels(version).number.xs((DISTRICT, 'Literate %'), level=('Region', 'Indicator'))['Total']
+urban_literacy, rural_literacy = district_literacy['Urban'], district_literacy['Rural']
+male_female_gap = percent(load_equity(version).parity.loc[(DISTRICT, 'Literate %'), 'Gender gap'])
 
 with col1:
     st.markdown(f"""
     <div class="stats-container">
-        <div class="stat-value">{urban_literacy:.1f}%</div>
+        <div class="stat-value">{urban_literacy}</div>
         <div class="stat-label">Urban Literacy Rate</div>
     </div>
     """, unsafe_allow_html=True)
@@ -119,7 +92,7 @@ with col1:
 with col2:
     st.markdown(f"""
     <div class="stats-container">
-        <div class="stat-value">{rural_literacy:.1f}%</div>
+        <div class="stat-value">{rural_literacy}</div>
         <div class="stat-label">Rural Literacy Rate</div>
     </div>
     """, unsafe_allow_html=True)
@@ -127,7 +100,7 @@ with col2:
 with col3:
     st.markdown(f"""
     <div class="stats-container">
-        <div class="stat-value">{male_female_gap:.1f}%</div>
+        <div class="stat-value">{male_female_gap}</div>
         <div class="stat-label">Gender Gap in Literacy</div>
     </div>
     """, unsafe_allow_html=True)
@@ -135,33 +108,15 @@ with col3:
 # Main visualization
 st.subheader("Literacy Rates by Region and Gender")
 
-# Filter data for literacy rates
-literacy_data = prepare_visualization_data(df)
-
-# Create bar chart
-fig_literacy = px.bar(
-    literacy_data,
-    x='Region',
-    y=['Male', 'Female'],
-    barmode='group',
-    title='Literacy Rates by Gender and Region',
-    color_discrete_sequence=['#2E2E2E', '#E5243B'],
-    labels={'value': 'Literacy Rate (%)', 'variable': 'Gender'}
-)
-
-fig_literacy.update_layout(
-    font_family="Poppins",
-    plot_bgcolor='rgba(0,0,0,0)',
-    paper_bgcolor='rgba(0,0,0,0)',
-    xaxis_title="Region",
-    yaxis_title="Literacy Rate (%)",
-    legend_title="Gender",
-    hoverlabel=dict(font_family="Poppins"),
-    title_font_family="Poppins"
-)
+# Sidebar filters drive the main chart
+version, selection = sidebar_filters('Literate %')
+fig_literacy = build_literacy_chart(version, selection)
 
 st.plotly_chart(fig_literacy, use_container_width=True)
 
+st.subheader("Tehsil Map")
+render_region_map(version, selection)
+
 # Additional insights
 st.markdown("""
 <div class="insight-box">
@@ -172,4 +127,6 @@ st.markdown("""
         <li>Female literacy rates in rural areas need immediate attention and intervention</li>
     </ul>
 </div>
-""", unsafe_allow_html=True) 
\ No newline at end of file
+""", unsafe_allow_html=True) 
+
+finish_page()
@@ -1,7 +1,10 @@
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
+
+from charts import comparison_chart, oosc_chart
+from education_data import DISTRICT, data_version, is_count
+from filters import load_labels, select, sidebar_filters, value_column
+from map_view import render_region_map
+from memory import finish_page, track_page
 
 # Set page config
 st.set_page_config(
@@ -9,6 +12,7 @@ st.set_page_config(
     page_icon="🚫",
     layout="wide"
 )
+track_page(__file__)
 
 # Custom CSS
 st.markdown("""
@@ -48,22 +52,6 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Helper functions
-def format_large_number(num):
-    if num >= 1_000_000:
-        return f"{num/1_000_000:.1f}M"
-    elif num >= 1_000:
-        return f"{num/1_000:.1f}K"
-    return str(num)
-
-# Load data
-@st.cache_data
-def load_data():
-    df = pd.read_csv('data_2023.csv')
-    return df
-
-df = load_data()
-
 # Page title
 st.title("🚫 Out-of-School Children Crisis")
 
@@ -80,20 +68,16 @@ st.markdown("""
 col1, col2, col3 = st.columns(3)
 
 # Calculate statistics
-total_oosc = df[
-    (df['Indicator'] == 'Out of School Children (5-16)') & 
-    (df['AreaType'] == 'Total') & 
-    (df['Region'] == 'Faisalabad District')
-]
+total_oosc = load_labels(data_version()).compact.loc[(DISTRICT, 'Total', 'Out of School Children (5-16)')]
 
-total_count = total_oosc['Total'].values[0]
-male_count = total_oosc['Male'].values[0]
-female_count = total_oosc['Female'].values[0]
+total_count = total_oosc['Total']
+male_count = total_oosc['Male']
+female_count = total_oosc['Female']
 
 with col1:
     st.markdown(f"""
     <div class="stats-container">
-        <div class="stat-value">{format_large_number(total_count)}</div>
+        <div class="stat-value">{total_count}</div>
         <div class="stat-label">Total Out-of-School Children</div>
     </div>
     """, unsafe_allow_html=True)
@@ -101,7 +85,7 @@ with col1:
 with col2:
     st.markdown(f"""
     <div class="stats-container">
-        <div class="stat-value">{format_large_number(male_count)}</div>
+        <div class="stat-value">{male_count}</div>
         <div class="stat-label">Boys Out of School</div>
     </div>
     """, unsafe_allow_html=True)
@@ -109,84 +93,47 @@ with col2:
 with col3:
     st.markdown(f"""
     <div class="stats-container">
-        <div class="stat-value">{format_large_number(female_count)}</div>
+        <div class="stat-value">{female_count}</div>
         <div class="stat-label">Girls Out of School</div>
     </div>
     """, unsafe_allow_html=True)
 
-# Main visualization
-st.subheader("Out-of-School Children by Region and Gender")
+# Chart builders, memoised per sidebar selection so recent selections
+# and their figures are served without rebuilding
+@st.cache_resource(max_entries=32)
+def build_oosc_chart(version, selection):
+    # Region totals only; the area type filter drives the comparison chart
+    oosc_data = select(version, selection._replace(area_types=('Total',)))
+
+    return oosc_chart(oosc_data, selection.indicator, selection.genders)
+
+
+@st.cache_resource(max_entries=32)
+def build_comparison_chart(version, selection):
+    # One bar per area type: the chosen gender, or everyone for 'All'
+    column = value_column(selection)
+    urban_rural_data = select(version, selection._replace(genders=(column,)))
 
-# Filter data for out-of-school children
-oosc_data = df[
-    (df['Indicator'] == 'Out of School Children (5-16)') & 
-    (df['AreaType'] == 'Total')
-].copy()
-
-# Create horizontal bar chart
-fig_oosc = go.Figure()
-
-fig_oosc.add_trace(go.Bar(
-    y=oosc_data['Region'],
-    x=oosc_data['Male'],
-    name='Boys',
-    orientation='h',
-    marker_color='#2E2E2E'
-))
-
-fig_oosc.add_trace(go.Bar(
-    y=oosc_data['Region'],
-    x=oosc_data['Female'],
-    name='Girls',
-    orientation='h',
-    marker_color='#E5243B'
-))
-
-fig_oosc.update_layout(
-    barmode='stack',
-    title='Out-of-School Children Distribution',
-    font_family="Poppins",
-    plot_bgcolor='rgba(0,0,0,0)',
-    paper_bgcolor='rgba(0,0,0,0)',
-    xaxis_title="Number of Children",
-    yaxis_title="Region",
-    hoverlabel=dict(font_family="Poppins"),
-    title_font_family="Poppins"
+    return comparison_chart(urban_rural_data, selection.indicator, column)
+
+# Sidebar filters drive both charts
+# The charts stack and sum children, so only count indicators are offered
+version, selection = sidebar_filters(
+    'Out of School Children (5-16)', area_types=('Urban', 'Rural'), indicators=is_count
 )
 
-st.plotly_chart(fig_oosc, use_container_width=True)
+# Main visualization
+st.subheader("Out-of-School Children by Region and Gender")
+
+st.plotly_chart(build_oosc_chart(version, selection), use_container_width=True)
 
 # Urban vs Rural Comparison
 st.subheader("Urban vs Rural Distribution")
 
-# Filter data for urban/rural comparison
-urban_rural_data = df[
-    (df['Indicator'] == 'Out of School Children (5-16)') & 
-    (df['AreaType'].isin(['Urban', 'Rural']))
-].copy()
-
-# Create comparison chart
-fig_comparison = px.bar(
-    urban_rural_data,
-    x='Region',
-    y='Total',
-    color='AreaType',
-    barmode='group',
-    title='Urban vs Rural Out-of-School Children',
-    color_discrete_sequence=['#2E2E2E', '#E5243B']
-)
-
-fig_comparison.update_layout(
-    font_family="Poppins",
-    plot_bgcolor='rgba(0,0,0,0)',
-    paper_bgcolor='rgba(0,0,0,0)',
-    xaxis_title="Region",
-    yaxis_title="Number of Children",
-    hoverlabel=dict(font_family="Poppins"),
-    title_font_family="Poppins"
-)
+st.plotly_chart(build_comparison_chart(version, selection), use_container_width=True)
 
-st.plotly_chart(fig_comparison, use_container_width=True)
+st.subheader("Tehsil Map")
+render_region_map(version, selection)
 
 # Additional insights
 st.markdown("""
@@ -199,4 +146,6 @@ st.markdown("""
         <li>Immediate intervention is needed to address this educational crisis</li>
     </ul>
 </div>
-""", unsafe_allow_html=True) 
\ No newline at end of file
+""", unsafe_allow_html=True) 
+
+finish_page()
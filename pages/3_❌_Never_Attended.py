@@ -1,8 +1,14 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import json
+
+from charts import area_breakdown, hierarchy_treemap, never_attended_bar
+from education_data import DISTRICT, VALUE_COLUMNS, data_version, is_count, latest_year, list_regions
+from filters import SUPPORTS_SELECTION, Selection, load_cube, load_labels, rerun, select, sidebar_filters
+from formatting import number, percent
+from hierarchy import HierarchyIndex
+from map_view import render_region_map
+from memory import finish_page, track_page
+from paged_table import PagedTable
+from table_view import render_paged_table
 
 # Set page config
 st.set_page_config(
@@ -10,6 +16,7 @@ st.set_page_config(
     page_icon="❌",
     layout="wide"
 )
+track_page(__file__)
 
 # Custom CSS
 st.markdown("""
@@ -85,23 +92,43 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Helper functions
-def format_large_number(num):
-    if num >= 1_000_000:
-        return f"{num/1_000_000:.1f}M"
-    elif num >= 1_000:
-        return f"{num/1_000:.1f}K"
-    return str(num)
+# Subtree totals for every region, area type and gender of an indicator,
+# aggregated once; selections only choose what a view shows. The treemap
+# materialises the node in view and the level just below it.
+@st.cache_resource(max_entries=8)
+def load_hierarchy(version, indicator):
+    leaves = select(version, Selection(
+        indicator, tuple(list_regions(load_cube(version))), ('Urban', 'Rural'), tuple(VALUE_COLUMNS)
+    ))
+    return HierarchyIndex(leaves, ['Region', 'AreaType'], VALUE_COLUMNS, "Faisalabad")
 
-# Load data
-@st.cache_data
-def load_data():
-    df = pd.read_csv('data_2023.csv')
-    with open('faisalabad_tehsils.geojson') as f:
-        geojson = json.load(f)
-    return df, geojson
+# Table rows with presorted indexes, so sorting, filtering and paging
+# only ever send the visible page to the browser
+@st.cache_resource(max_entries=32)
+def load_table(version, selection, value_column, _viz_data):
+    display_cols = ['Region', 'AreaType', 'Total', 'Male', 'Female', 'Percentage']
+    formats = {'Total': number, 'Male': number, 'Female': number, 'Percentage': percent}
+    return PagedTable(_viz_data[display_cols], formats)
+
+# Regions and area types of the selection shown in the treemap
+def treemap_keep(selection):
+    return {'Region': selection.regions, 'AreaType': selection.area_types}
+
+def open_node(node):
+    st.session_state['treemap_node'] = node
+    rerun()
+
+@st.cache_resource(max_entries=64)
+def build_treemap(version, selection, value_column, node, _hierarchy):
+    return hierarchy_treemap(
+        _hierarchy.view(node, depth=1, value_column=value_column, keep=treemap_keep(selection)),
+        'Distribution of Out-of-School Children by Region'
+    )
 
-df, geojson = load_data()
+# Bar labels are formatted once per selection rather than on every rerun
+@st.cache_resource(max_entries=32)
+def build_bar(version, selection, value_column, _viz_data):
+    return never_attended_bar(_viz_data, value_column)
 
 # Title and description
 st.markdown("""
@@ -114,14 +141,8 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-# Filter data for never attended school (specifically for age group 5-16)
-never_attended_df = df[df['Indicator'] == 'Never to School (5-16)'].copy()
-
-# Get district level statistics
-district_stats = never_attended_df[
-    (never_attended_df['Region'] == 'Faisalabad District') & 
-    (never_attended_df['AreaType'] == 'Total')
-].iloc[0]
+# District level statistics for children aged 5-16
+district_stats = load_labels(data_version()).compact.loc[(DISTRICT, 'Total', 'Never to School (5-16)')]
 
 # Create metrics cards
 col1, col2, col3 = st.columns(3)
@@ -129,7 +150,7 @@ col1, col2, col3 = st.columns(3)
 with col1:
     st.markdown(f"""
     <div class="metric-card">
-        <p class="metric-value">{district_stats['Total']:,.1f}K</p>
+        <p class="metric-value">{district_stats['Total']}</p>
         <p class="metric-label">Total Children Never Attended School</p>
     </div>
     """, unsafe_allow_html=True)
@@ -137,7 +158,7 @@ with col1:
 with col2:
     st.markdown(f"""
     <div class="metric-card">
-        <p class="metric-value">{district_stats['Male']:,.1f}K</p>
+        <p class="metric-value">{district_stats['Male']}</p>
         <p class="metric-label">Boys Never Attended School</p>
     </div>
     """, unsafe_allow_html=True)
@@ -145,178 +166,88 @@ with col2:
 with col3:
     st.markdown(f"""
     <div class="metric-card">
-        <p class="metric-value">{district_stats['Female']:,.1f}K</p>
+        <p class="metric-value">{district_stats['Female']}</p>
         <p class="metric-label">Girls Never Attended School</p>
     </div>
     """, unsafe_allow_html=True)
 
 st.markdown("---")
 
-# Prepare data for visualization
-viz_data = never_attended_df[never_attended_df['Region'] != 'Faisalabad District'].copy()
-viz_data = viz_data[viz_data['AreaType'] != 'Total']
-
-# Ensure both Urban and Rural exist for each region
-all_regions = viz_data['Region'].unique()
-all_area_types = ['Urban', 'Rural']
-complete_data = []
+# Sidebar filters drive the charts and table below
+# Shares and treemap totals add areas up, so only count indicators are offered
+version, selection = sidebar_filters(
+    'Never to School (5-16)', genders=('Total',), include_district=False, indicators=is_count
+)
+value_column = selection.genders[0]
+table_columns = tuple(dict.fromkeys(('Total', 'Male', 'Female', value_column)))
 
-for region in all_regions:
-    region_data = viz_data[viz_data['Region'] == region]
-    total_region = region_data['Total'].sum()
-    
-    for area_type in all_area_types:
-        area_data = region_data[region_data['AreaType'] == area_type]
-        if len(area_data) == 0:
-            # If this area type doesn't exist, add it with 0 values
-            complete_data.append({
-                'Region': region,
-                'AreaType': area_type,
-                'Total': 0,
-                'Male': 0,
-                'Female': 0
-            })
-        else:
-            complete_data.extend(area_data.to_dict('records'))
-
-viz_data = pd.DataFrame(complete_data)
-
-# Calculate percentages for each area type
-viz_data['Percentage'] = (viz_data['Total'] / viz_data.groupby('Region')['Total'].transform('sum') * 100).round(1)
+# Prepare data for visualization
+viz_data = select(version, selection._replace(genders=table_columns))
+viz_data = area_breakdown(viz_data, value_column)
+if viz_data.empty:
+    st.info("No data for the selected filters.")
+    st.stop()
 
 # Create tabs for different visualizations
-tab1, tab2 = st.tabs(["📊 Distribution Overview", "📈 Detailed Comparison"])
+tab1, tab2, tab3 = st.tabs(["📊 Distribution Overview", "📈 Detailed Comparison", "🗺️ Tehsil Map"])
 
 with tab1:
-    # Create treemap
-    treemap_data = viz_data.copy()
-    treemap_data['Percentage_Label'] = treemap_data['Percentage'].apply(lambda x: f'{x:.1f}%')
-    
-    # Create color mapping
-    treemap_data['Color'] = treemap_data['AreaType'].map({
-        'Urban': '#7a0000',  # Dark red for urban
-        'Rural': '#E5243B'   # Light red for rural
-    })
-    
-    fig_treemap = px.treemap(
-        treemap_data,
-        path=[px.Constant("Faisalabad"), 'Region', 'AreaType'],
-        values='Total',
-        color='AreaType',
-        color_discrete_map={
-            'Urban': '#7a0000',  # Dark red for urban
-            'Rural': '#E5243B'   # Light red for rural
-        },
-        custom_data=['Total', 'Percentage_Label']
-    )
-    
-    fig_treemap.update_traces(
-        textinfo="label",
-        hovertemplate="""
-<b>%{label}</b><br>
-Number of children: %{customdata[0]:,.0f}<br>
-Percentage: %{customdata[1]}<extra></extra>
-""",
-        textfont={"color": "white"}  # Make text white for better visibility
-    )
-    
-    fig_treemap.update_layout(
-        title={
-            'text': 'Distribution of Out-of-School Children by Region',
-            'y':0.95,
-            'x':0.5,
-            'xanchor': 'center',
-            'yanchor': 'top'
-        },
-        height=600,
-        # Remove color axis since we're using discrete colors
-        coloraxis_showscale=False
-    )
-    
-    st.plotly_chart(fig_treemap, use_container_width=True)
+    hierarchy = load_hierarchy(version, selection.indicator)
+    keep = treemap_keep(selection)
+    node = st.session_state.get('treemap_node', hierarchy.root)
+    if not hierarchy.contains(node, keep):
+        node = hierarchy.root
+
+    # Drill-down controls: children are materialised only when opened
+    col1, col2 = st.columns([3, 1])
+    drillable = [
+        child for child in hierarchy.children[node]
+        if hierarchy.children[child] and hierarchy.contains(child, keep)
+    ]
+    with col1:
+        if SUPPORTS_SELECTION:
+            if drillable:
+                st.caption("Click a tehsil to open it; click the top bar to go back up.")
+        elif drillable:
+            child = st.selectbox(
+                "Drill into",
+                [None] + drillable,
+                format_func=lambda n: "—" if n is None else hierarchy.labels[n]
+            )
+            if child is not None:
+                open_node(child)
+    with col2:
+        if node != hierarchy.root:
+            parent = hierarchy.parents[node]
+            if st.button(f"⬆ Back to {hierarchy.labels[parent]}"):
+                open_node(parent)
+
+    fig_treemap = build_treemap(version, selection, value_column, node, hierarchy)
+    if SUPPORTS_SELECTION:
+        # Keyed on the node shown so each view starts with no selection
+        event = st.plotly_chart(
+            fig_treemap,
+            use_container_width=True,
+            on_select='rerun',
+            selection_mode='points',
+            key=f'treemap-{node}'
+        )
+        for point in event.selection.points if event else []:
+            clicked = point.get('id')
+            if clicked in drillable:
+                open_node(clicked)
+            elif clicked == node and node != hierarchy.root:
+                open_node(hierarchy.parents[node])
+    else:
+        st.plotly_chart(fig_treemap, use_container_width=True)
 
 with tab2:
-    # Create bar chart
-    fig_bar = go.Figure()
-
-    # Add bars for Urban
-    urban_data = viz_data[viz_data['AreaType'] == 'Urban']
-    fig_bar.add_trace(go.Bar(
-        name='Urban',
-        x=urban_data['Region'],
-        y=urban_data['Total'],
-        text=urban_data['Total'].apply(lambda x: f'{x:,.0f}'),
-        textposition='auto',
-        marker_color='#7a0000',  # Dark red for urban
-        hovertemplate='<b>%{x}</b><br>' +
-                    'Urban Areas<br>' +
-                    'Children: %{text}<br>' +
-                    'Percentage: %{customdata}%<extra></extra>',
-        customdata=urban_data['Percentage'].round(1)
-    ))
-
-    # Add bars for Rural
-    rural_data = viz_data[viz_data['AreaType'] == 'Rural']
-    fig_bar.add_trace(go.Bar(
-        name='Rural',
-        x=rural_data['Region'],
-        y=rural_data['Total'],
-        text=rural_data['Total'].apply(lambda x: f'{x:,.0f}'),
-        textposition='auto',
-        marker_color='#E5243B',  # Light red for rural
-        hovertemplate='<b>%{x}</b><br>' +
-                    'Rural Areas<br>' +
-                    'Children: %{text}<br>' +
-                    'Percentage: %{customdata}%<extra></extra>',
-        customdata=rural_data['Percentage'].round(1)
-    ))
-
-    # Update layout
-    fig_bar.update_layout(
-        title={
-            'text': 'Urban vs Rural Distribution of Out-of-School Children',
-            'y':0.95,
-            'x':0.5,
-            'xanchor': 'center',
-            'yanchor': 'top'
-        },
-        xaxis_title="Region",
-        yaxis_title="Number of Children",
-        barmode='group',
-        bargap=0.2,
-        bargroupgap=0.1,
-        height=500,
-        showlegend=True,
-        legend=dict(
-            yanchor="top",
-            y=0.99,
-            xanchor="right",
-            x=0.99
-        ),
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-    )
-
-    # Update axes
-    fig_bar.update_xaxes(
-        tickangle=45,
-        title_font={"size": 14},
-        title_standoff=25,
-        gridcolor='#F0F0F0'
-    )
-
-    fig_bar.update_yaxes(
-        title_font={"size": 14},
-        title_standoff=25,
-        gridcolor='#F0F0F0',
-        zeroline=True,
-        zerolinecolor='#E0E0E0',
-        zerolinewidth=1
-    )
-
-    # Display the chart
+    fig_bar = build_bar(version, selection, value_column, viz_data)
     st.plotly_chart(fig_bar, use_container_width=True)
 
+with tab3:
+    render_region_map(version, selection)
+
 # Add insights
 st.markdown("""
 ### Key Insights
@@ -332,23 +263,20 @@ st.markdown("""
 
 # Display raw data in an expander
 with st.expander("View Tehsil-wise Data"):
-    st.markdown("""
+    st.markdown(f"""
     This table shows the breakdown of children (ages 5-16) who have never attended school across different tehsils of Faisalabad.
-    Numbers are based on Census 2023 data.
+    Numbers are based on Census {latest_year()} data.
     """)
-    display_cols = ['Region', 'AreaType', 'Total', 'Male', 'Female', 'Percentage']
-    formatted_df = viz_data[display_cols].copy()
-    formatted_df = formatted_df.sort_values(['Region', 'AreaType'])
-    st.dataframe(
-        formatted_df,
+    render_paged_table(
+        load_table(version, selection, value_column, viz_data),
+        key='tehsil_table',
+        default_sort='Region',
         column_config={
-            'Total': st.column_config.NumberColumn(
-                help="Total number of children who never attended school",
-                format="%d"
+            'Total': st.column_config.Column(
+                help="Total number of children who never attended school"
             ),
-            'Percentage': st.column_config.NumberColumn(
-                help="Percentage of total children in the region",
-                format="%.1f%%"
+            'Percentage': st.column_config.Column(
+                help="Percentage of total children in the region"
             )
         }
     )
@@ -374,4 +302,6 @@ st.markdown("""
     Each number is a story of potential waiting to be unlocked. Together, we can work to ensure every 
     child has access to quality education.</p>
 </div>
-""", unsafe_allow_html=True) 
\ No newline at end of file
+""", unsafe_allow_html=True) 
+
+finish_page()
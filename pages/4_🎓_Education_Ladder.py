@@ -0,0 +1,154 @@
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+
+from education_data import DISTRICT, data_version, latest_year, list_regions
+from filters import load_cube
+from ladder import TRANSITIONS, build_ladder
+from memory import finish_page, track_page
+
+# Set page config
+st.set_page_config(
+    page_title="Education Ladder - Education Access in Faisalabad",
+    page_icon="🎓",
+    layout="wide"
+)
+track_page(__file__)
+
+# Custom CSS
+st.markdown("""
+<style>
+    /* Typography */
+    * {
+        font-family: 'Poppins', sans-serif;
+    }
+    
+    /* Insight Box */
+    .insight-box {
+        background-color: #FCE4E4;
+        padding: 1.5rem;
+        border-radius: 10px;
+        border-left: 5px solid #E5243B;
+        margin: 1rem 0;
+    }
+</style>
+""", unsafe_allow_html=True)
+
+FUNNEL_COLORS = ['#E5243B', '#2E2E2E', '#7a0000', '#F28B82', '#6B7280', '#B91C1C', '#9CA3AF']
+
+# Stage counts and transition ratios for every region, computed once
+# per data version
+@st.cache_resource(max_entries=2)
+def load_ladder(version):
+    return build_ladder(load_cube(version))
+
+@st.cache_resource(max_entries=32)
+def build_funnel_chart(version, regions, area_type, gender):
+    counts, _ = load_ladder(version)
+    fig_funnel = go.Figure()
+
+    for i, region in enumerate(regions):
+        if (region, area_type) not in counts.index:
+            continue
+        stages = counts.loc[(region, area_type), gender]
+        fig_funnel.add_trace(go.Funnel(
+            name=region,
+            y=stages.index,
+            x=stages.values,
+            textinfo="value+percent previous",
+            marker_color=FUNNEL_COLORS[i % len(FUNNEL_COLORS)]
+        ))
+
+    fig_funnel.update_layout(
+        title=f'Education Ladder ({area_type}, {gender})',
+        font_family="Poppins",
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        hoverlabel=dict(font_family="Poppins"),
+        title_font_family="Poppins",
+        height=550
+    )
+    return fig_funnel
+
+@st.cache_resource(max_entries=32)
+def build_transition_heatmap(version, area_type, gender):
+    _, ratios = load_ladder(version)
+    area_ratios = ratios.xs(area_type, level='AreaType')[gender] * 100
+
+    fig_heatmap = px.imshow(
+        area_ratios,
+        x=TRANSITIONS,
+        y=area_ratios.index,
+        color_continuous_scale=['#FCE4E4', '#E5243B', '#7a0000'],
+        text_auto='.1f',
+        aspect='auto',
+        labels={'color': 'Ratio to previous stage (%)'}
+    )
+
+    fig_heatmap.update_layout(
+        title=f'Ratio to Previous Stage by Region ({area_type}, {gender})',
+        font_family="Poppins",
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        xaxis_title="Transition",
+        yaxis_title="Region",
+        hoverlabel=dict(font_family="Poppins"),
+        title_font_family="Poppins"
+    )
+    return fig_heatmap
+
+version = data_version()
+regions = list_regions(load_cube(version))
+
+# Page title
+st.title("🎓 Education Ladder")
+
+# Introduction
+st.markdown(f"""
+<div class="insight-box">
+    <h3>How Far Do Learners Progress?</h3>
+    <p>The ladder follows learners from ever attending school through each enrolment stage up to graduation.
+    Each step compares the count at a stage with the stage below it. These are Census {latest_year()}
+    counts across age groups rather than a tracked cohort, so a ratio is not a retention rate and can pass
+    100% where a later stage spans more ages; read the ratios as a snapshot of where the ladder narrows.</p>
+</div>
+""", unsafe_allow_html=True)
+
+col1, col2, col3 = st.columns([3, 1, 1])
+
+with col1:
+    chosen_regions = st.multiselect("Regions", regions, default=[DISTRICT])
+with col2:
+    area_type = st.selectbox("Area Type", ['Total', 'Urban', 'Rural'])
+with col3:
+    gender = st.selectbox("Gender", ['Total', 'Male', 'Female'])
+
+st.subheader("Ladder Funnel")
+st.plotly_chart(
+    build_funnel_chart(version, tuple(chosen_regions), area_type, gender),
+    use_container_width=True
+)
+
+st.subheader("Transition Ratios Across Regions")
+st.plotly_chart(build_transition_heatmap(version, area_type, gender), use_container_width=True)
+
+with st.expander("View Transition Ratios"):
+    _, ratios = load_ladder(version)
+    st.dataframe(
+        (ratios.xs(area_type, level='AreaType')[gender] * 100).round(1),
+        use_container_width=True
+    )
+
+# Additional insights
+st.markdown("""
+<div class="insight-box">
+    <h3>Reading the Ladder</h3>
+    <ul>
+        <li>The sharpest narrowing shows where learners most often leave education</li>
+        <li>Comparing Urban and Rural highlights where distance to schools limits progression</li>
+        <li>Gender differences at Middle and Matric point to barriers faced by adolescent girls and boys</li>
+    </ul>
+</div>
+""", unsafe_allow_html=True)
+
+finish_page()
@@ -0,0 +1,118 @@
+import streamlit as st
+import plotly.express as px
+
+from education_data import DATA_FILE_PATTERN, available_years, data_version, year_path
+from filters import GENDER_OPTIONS, load_cube
+from memory import finish_page, track_page
+from trends import TREND_INDICATORS, year_over_year
+
+# Set page config
+st.set_page_config(
+    page_title="Trends - Education Access in Faisalabad",
+    page_icon="📈",
+    layout="wide"
+)
+track_page(__file__)
+
+# Custom CSS
+st.markdown("""
+<style>
+    /* Typography */
+    * {
+        font-family: 'Poppins', sans-serif;
+    }
+    
+    /* Insight Box */
+    .insight-box {
+        background-color: #FCE4E4;
+        padding: 1.5rem;
+        border-radius: 10px;
+        border-left: 5px solid #E5243B;
+        margin: 1rem 0;
+    }
+</style>
+""", unsafe_allow_html=True)
+
+# Year-over-year changes for the years on screen. Only those years'
+# files are loaded, and results are keyed on their data versions.
+@st.cache_resource(max_entries=8)
+def load_changes(versions, years):
+    cubes = {
+        year: load_cube(version, year_path(year))
+        for version, year in zip(versions, years)
+    }
+    return year_over_year(cubes)
+
+@st.cache_resource(max_entries=32)
+def build_change_chart(versions, years, indicator, area_type, gender, measure):
+    changes, growth = load_changes(versions, years)
+    data = (changes if measure == 'Change' else growth)[gender]
+    data = data.xs((indicator, area_type), level=('Indicator', 'AreaType')).reset_index()
+
+    fig_change = px.bar(
+        data,
+        x='Region',
+        y=gender,
+        title=f'{indicator}: {measure} {years[0]}→{years[1]} ({area_type})',
+        color_discrete_sequence=['#E5243B']
+    )
+
+    fig_change.update_layout(
+        font_family="Poppins",
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        xaxis_title="Region",
+        yaxis_title="Growth (%)" if measure == 'Growth %' else "Change",
+        hoverlabel=dict(font_family="Poppins"),
+        title_font_family="Poppins"
+    )
+    return fig_change
+
+# Page title
+st.title("📈 Census Trends")
+
+years = available_years()
+if len(years) < 2:
+    st.markdown(f"""
+    <div class="insight-box">
+        <h3>Only one census release available</h3>
+        <p>Year-over-year changes appear here once another release is added next to
+        <code>{DATA_FILE_PATTERN.format(year=years[0])}</code> as <code>data_&lt;year&gt;.csv</code>.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    st.stop()
+
+col1, col2 = st.columns(2)
+with col1:
+    base_year = st.selectbox("From", years[:-1], index=len(years) - 2)
+with col2:
+    compare_year = st.selectbox("To", [year for year in years if year > base_year], index=0)
+
+col1, col2, col3, col4 = st.columns(4)
+with col1:
+    indicator = st.selectbox("Indicator", TREND_INDICATORS)
+with col2:
+    area_type = st.selectbox("Area Type", ['Total', 'Urban', 'Rural'])
+with col3:
+    gender = st.selectbox("Gender", ['Total'] + GENDER_OPTIONS[1:])
+with col4:
+    measure = st.radio("Show", ['Change', 'Growth %'])
+
+chosen_years = (base_year, compare_year)
+versions = tuple(data_version(year_path(year)) for year in chosen_years)
+
+st.plotly_chart(
+    build_change_chart(versions, chosen_years, indicator, area_type, gender, measure),
+    use_container_width=True
+)
+
+with st.expander("View Year-over-Year Data"):
+    changes, growth = load_changes(versions, chosen_years)
+    table = changes[gender].rename('Change').to_frame()
+    table['Growth %'] = growth[gender].round(1)
+    st.dataframe(
+        table.xs(indicator, level='Indicator').reset_index(level='Period', drop=True),
+        use_container_width=True
+    )
+
+finish_page()
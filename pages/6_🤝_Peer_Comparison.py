@@ -0,0 +1,111 @@
+import streamlit as st
+import plotly.express as px
+
+from education_data import data_version, list_regions
+from filters import load_cube
+from memory import finish_page, track_page
+from peers import build_peers, nearest_peers, region_level
+
+# Set page config
+st.set_page_config(
+    page_title="Peer Comparison - Education Access in Faisalabad",
+    page_icon="🤝",
+    layout="wide"
+)
+track_page(__file__)
+
+# Custom CSS
+st.markdown("""
+<style>
+    /* Typography */
+    * {
+        font-family: 'Poppins', sans-serif;
+    }
+    
+    /* Insight Box */
+    .insight-box {
+        background-color: #FCE4E4;
+        padding: 1.5rem;
+        border-radius: 10px;
+        border-left: 5px solid #E5243B;
+        margin: 1rem 0;
+    }
+</style>
+""", unsafe_allow_html=True)
+
+# Profiles, pairwise distances and percentile ranks for every region,
+# computed once per data version and area type
+@st.cache_resource(max_entries=6)
+def load_peers(version, area_type):
+    return build_peers(load_cube(version), area_type)
+
+@st.cache_resource(max_entries=64)
+def build_percentile_chart(version, area_type, region):
+    percentiles = load_peers(version, area_type).percentiles.loc[region]
+
+    fig_percentiles = px.bar(
+        x=percentiles.values,
+        y=percentiles.index,
+        orientation='h',
+        range_x=[0, 100],
+        title=f'{region}: Percentile Among {region_level(region)}s',
+        color_discrete_sequence=['#E5243B']
+    )
+
+    fig_percentiles.update_layout(
+        font_family="Poppins",
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        xaxis_title="Percentile",
+        yaxis_title="",
+        hoverlabel=dict(font_family="Poppins"),
+        title_font_family="Poppins"
+    )
+    return fig_percentiles
+
+version = data_version()
+regions = list_regions(load_cube(version))
+
+# Page title
+st.title("🤝 Peer Comparison")
+
+st.markdown("""
+<div class="insight-box">
+    <h3>Who Looks Most Alike?</h3>
+    <p>Each district and tehsil is described by literacy by gender and by out-of-school, never-attended and
+    drop-out counts per 100 people aged 5 and above. Peers are the regions at the same level with the most
+    similar profile once every indicator is put on the same scale.</p>
+</div>
+""", unsafe_allow_html=True)
+
+col1, col2 = st.columns([3, 1])
+with col1:
+    region = st.selectbox("Region", regions, index=min(1, len(regions) - 1))
+with col2:
+    area_type = st.selectbox("Area Type", ['Total', 'Urban', 'Rural'])
+
+peers = load_peers(version, area_type)
+if region not in peers.profiles.index:
+    st.info(f"No {area_type.lower()} figures for {region}.")
+    st.stop()
+
+col1, col2 = st.columns(2)
+
+with col1:
+    st.subheader("Nearest Peers")
+    closest = nearest_peers(peers, region)
+    if closest.empty:
+        st.info(f"No other {region_level(region).lower()}s to compare with yet.")
+    else:
+        table = peers.profiles.loc[[region] + closest.index.tolist()].round(2)
+        table.insert(0, 'Distance', closest.reindex(table.index).round(2))
+        st.dataframe(table, use_container_width=True)
+
+with col2:
+    st.subheader("Percentile Ranks")
+    st.plotly_chart(build_percentile_chart(version, area_type, region), use_container_width=True)
+
+st.caption("Percentiles are within the same level; higher means a larger value, which is better for literacy "
+           "and worse for the other indicators.")
+
+finish_page()
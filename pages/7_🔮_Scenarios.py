@@ -0,0 +1,144 @@
+import streamlit as st
+import plotly.express as px
+
+from education_data import data_version, list_regions
+from filters import load_cube
+from memory import finish_page, track_page
+from scenarios import METRICS, Intervention, build_baseline, simulate, summarise
+
+# Set page config
+st.set_page_config(
+    page_title="Scenarios - Education Access in Faisalabad",
+    page_icon="🔮",
+    layout="wide"
+)
+track_page(__file__)
+
+# Custom CSS
+st.markdown("""
+<style>
+    /* Typography */
+    * {
+        font-family: 'Poppins', sans-serif;
+    }
+
+    /* Insight Box */
+    .insight-box {
+        background-color: #FCE4E4;
+        padding: 1.5rem;
+        border-radius: 10px;
+        border-left: 5px solid #E5243B;
+        margin: 1rem 0;
+    }
+</style>
+""", unsafe_allow_html=True)
+
+MAX_INTERVENTIONS = 3
+
+@st.cache_resource(max_entries=4)
+def load_baseline(version):
+    return build_baseline(load_cube(version))
+
+# Interventions are tuples, so every scenario is simulated once per data version
+@st.cache_resource(max_entries=32)
+def run_scenario(version, interventions, draws):
+    return simulate(load_baseline(version), interventions, draws=draws)
+
+def build_distribution_chart(totals, metric):
+    fig_distribution = px.histogram(
+        x=totals,
+        nbins=60,
+        title=f'Change in {metric} Across Draws',
+        color_discrete_sequence=['#E5243B']
+    )
+
+    fig_distribution.update_layout(
+        font_family="Poppins",
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        xaxis_title="Change in Children",
+        yaxis_title="Draws",
+        hoverlabel=dict(font_family="Poppins"),
+        title_font_family="Poppins"
+    )
+    return fig_distribution
+
+version = data_version()
+tehsils = [region for region in list_regions(load_cube(version)) if not region.endswith('District')]
+
+# Page title
+st.title("🔮 What-If Scenarios")
+
+st.markdown("""
+<div class="insight-box">
+    <h3>What Would It Take?</h3>
+    <p>Describe an intervention, such as raising rural female enrolment by 10% in Jaranwala and Samundri,
+    and see how many fewer children would be out of school. Each effect is uncertain, so the scenario is
+    run thousands of times with effects drawn from the given range.</p>
+</div>
+""", unsafe_allow_html=True)
+
+count = st.number_input("Interventions", min_value=1, max_value=MAX_INTERVENTIONS, value=1)
+
+interventions = []
+for i in range(int(count)):
+    with st.expander(f"Intervention {i + 1}", expanded=True):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            regions = st.multiselect("Tehsils", tehsils, default=tehsils[:2], key=f"scenario_regions_{i}")
+        with col2:
+            area_types = st.multiselect("Area Types", ['Urban', 'Rural'], default=['Rural'],
+                                        key=f"scenario_area_types_{i}")
+        with col3:
+            genders = st.multiselect("Genders", ['Male', 'Female'], default=['Female'],
+                                     key=f"scenario_genders_{i}")
+
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            enrolment = st.slider("Enrolment increase (%)", 0, 50, 10, key=f"scenario_enrolment_{i}")
+        with col2:
+            dropouts = st.slider("Drop-out reduction (%)", 0, 100, 0, key=f"scenario_dropouts_{i}")
+        with col3:
+            never_attended = st.slider("Never-attended reduction (%)", 0, 100, 0,
+                                       key=f"scenario_never_attended_{i}")
+        with col4:
+            uncertainty = st.slider("Uncertainty (± % of effect)", 0, 100, 30, key=f"scenario_uncertainty_{i}")
+
+    interventions.append(Intervention(
+        tuple(regions), tuple(area_types), tuple(genders),
+        enrolment / 100, dropouts / 100, never_attended / 100, uncertainty / 100,
+    ))
+
+col1, col2 = st.columns([3, 1])
+with col1:
+    metric = st.selectbox("Indicator", METRICS)
+with col2:
+    draws = st.select_slider("Draws", [1000, 2000, 5000, 10000], value=5000)
+
+simulation = run_scenario(version, tuple(interventions), draws)
+summary = summarise(simulation, metric)
+overall = summary.loc['All']
+baseline_total = simulation.baseline[metric].sum()
+
+col1, col2, col3 = st.columns(3)
+with col1:
+    st.metric("Baseline", f"{baseline_total:,.0f}")
+with col2:
+    st.metric("Expected Change", f"{overall['Mean change']:+,.0f}",
+              f"{overall['Mean change'] / baseline_total:+.1%}" if baseline_total else None,
+              delta_color="off")
+with col3:
+    st.metric("90% Range", f"{overall['5th percentile']:+,.0f} to {overall['95th percentile']:+,.0f}")
+
+col1, col2 = st.columns(2)
+with col1:
+    totals = (simulation.draws[metric] - simulation.baseline[metric]).sum(axis=1)
+    st.plotly_chart(build_distribution_chart(totals, metric), use_container_width=True)
+with col2:
+    st.subheader("Change by Tehsil")
+    st.dataframe(summary.round(0), use_container_width=True)
+
+st.caption("Enrolment counts primary, middle and matric enrolment. New pupils are drawn from out-of-school "
+           "children in proportion to how many never attended and how many dropped out.")
+
+finish_page()
@@ -0,0 +1,132 @@
+import streamlit as st
+import plotly.express as px
+
+from education_data import data_version, list_indicators, list_regions
+from filters import load_cube, load_equity
+from memory import finish_page, track_page
+
+# Set page config
+st.set_page_config(
+    page_title="Equity - Education Access in Faisalabad",
+    page_icon="⚖️",
+    layout="wide"
+)
+track_page(__file__)
+
+# Custom CSS
+st.markdown("""
+<style>
+    /* Typography */
+    * {
+        font-family: 'Poppins', sans-serif;
+    }
+
+    /* Insight Box */
+    .insight-box {
+        background-color: #FCE4E4;
+        padding: 1.5rem;
+        border-radius: 10px;
+        border-left: 5px solid #E5243B;
+        margin: 1rem 0;
+    }
+</style>
+""", unsafe_allow_html=True)
+
+@st.cache_resource(max_entries=32)
+def build_parity_chart(version, indicator):
+    parity = load_equity(version).parity.xs(indicator, level='Indicator')
+    parity = parity.reindex(list_regions(load_cube(version)))
+    data = parity[['Gender parity index', 'Rural/urban parity index']].reset_index().melt(
+        id_vars='Region', var_name='Index', value_name='Value'
+    )
+
+    fig_parity = px.bar(
+        data,
+        x='Region',
+        y='Value',
+        color='Index',
+        barmode='group',
+        title=f'Parity Indices: {indicator}',
+        color_discrete_sequence=['#E5243B', '#4C9F38']
+    )
+    # Parity is 1: equal female/male or rural/urban values
+    fig_parity.add_hline(y=1, line_dash='dash', line_color='#2E2E2E')
+
+    fig_parity.update_layout(
+        font_family="Poppins",
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        xaxis_title="",
+        yaxis_title="Parity Index",
+        legend_title="",
+        hoverlabel=dict(font_family="Poppins"),
+        title_font_family="Poppins"
+    )
+    return fig_parity
+
+@st.cache_resource(max_entries=32)
+def build_dispersion_chart(version, group, gender, measure):
+    dispersion = load_equity(version).dispersion.xs((group, gender), level=['Group', 'Gender'])
+    dispersion = dispersion[measure].sort_values()
+
+    fig_dispersion = px.bar(
+        x=dispersion.values,
+        y=dispersion.index,
+        orientation='h',
+        title=f'{measure} Across {group} ({gender})',
+        color_discrete_sequence=['#E5243B']
+    )
+
+    fig_dispersion.update_layout(
+        font_family="Poppins",
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        xaxis_title=measure,
+        yaxis_title="",
+        hoverlabel=dict(font_family="Poppins"),
+        title_font_family="Poppins"
+    )
+    return fig_dispersion
+
+version = data_version()
+equity = load_equity(version)
+
+# Page title
+st.title("⚖️ Equity and Inequality")
+
+st.markdown("""
+<div class="insight-box">
+    <h3>How Evenly Is Education Shared?</h3>
+    <p>Parity indices compare female with male and rural with urban figures, where 1 means equal.
+    Gini, Theil and the coefficient of variation measure how unevenly an indicator is spread across
+    the tehsils of a district; 0 means every tehsil is the same.</p>
+</div>
+""", unsafe_allow_html=True)
+
+indicators = list_indicators(load_cube(version))
+indicator = st.selectbox("Indicator", indicators, index=indicators.index('Literate %'))
+
+st.subheader("Gender and Urban/Rural Parity")
+st.plotly_chart(build_parity_chart(version, indicator), use_container_width=True)
+st.dataframe(equity.parity.xs(indicator, level='Indicator').round(3), use_container_width=True)
+
+st.subheader("Dispersion Across Tehsils")
+groups = equity.dispersion.index.get_level_values('Group').unique().tolist()
+col1, col2, col3 = st.columns(3)
+with col1:
+    group = st.selectbox("Across", groups)
+with col2:
+    gender = st.selectbox("Gender", ['Total', 'Male', 'Female'])
+with col3:
+    measure = st.selectbox("Measure", ['Gini', 'Theil', 'Coefficient of variation'])
+
+st.plotly_chart(build_dispersion_chart(version, group, gender, measure), use_container_width=True)
+st.dataframe(
+    equity.dispersion.xs((group, indicator), level=['Group', 'Indicator']).round(3),
+    use_container_width=True
+)
+
+st.caption("Counts are compared per 100 people aged 5 and above, so tehsils are not unequal just for being "
+           "larger; percentages and populations are compared as they are.")
+
+finish_page()
@@ -0,0 +1,70 @@
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+# Profile features: (name, indicator, gender column, per-capita base).
+# Rates use the population aged 5+ as the base, the closest age group
+# the census tables give.
+PROFILE_FEATURES = [
+    ('Male literacy (%)', 'Literate %', 'Male', None),
+    ('Female literacy (%)', 'Literate %', 'Female', None),
+    ('Out of school per 100 aged 5+', 'Out of School Children (5-16)', 'Total', 'Population >=5'),
+    ('Never attended per 100 aged 5+', 'Never to School (all)', 'Total', 'Population >=5'),
+    ('Drop-outs per 100 aged 5+', 'Drop Out (5-16)', 'Total', 'Population >=5'),
+]
+
+Peers = namedtuple('Peers', ['profiles', 'distances', 'percentiles'])
+
+
+def region_level(region):
+    # 'Faisalabad District' -> 'District', 'Jaranwala Tehsil' -> 'Tehsil'
+    return region.rsplit(' ', 1)[-1]
+
+
+def build_profiles(cube, area_type='Total'):
+    """One row per region with every profile feature, built as array operations."""
+    data = cube.xs(area_type, level='AreaType')
+    wide = data.unstack('Indicator')
+    columns = {}
+    for name, indicator, gender, base in PROFILE_FEATURES:
+        values = wide[(gender, indicator)].to_numpy(dtype=float)
+        if base is not None:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                values = values / wide[('Total', base)].to_numpy(dtype=float) * 100
+        columns[name] = values
+    # Regions without this area type (no rural part) have no profile
+    return pd.DataFrame(columns, index=wide.index).dropna(how='all')
+
+
+def build_peers(cube, area_type='Total'):
+    """Profiles, pairwise profile distances and within-level percentile ranks.
+
+    Features are z-scored within each level (districts, tehsils) so every
+    indicator weighs the same; distances are Euclidean over those scores
+    and are NaN between regions of different levels.
+    """
+    profiles = build_profiles(cube, area_type)
+    levels = profiles.index.map(region_level).to_numpy()
+    values = profiles.to_numpy(dtype=float)
+
+    scores = np.full_like(values, np.nan)
+    for level in np.unique(levels):
+        rows = levels == level
+        mean = np.nanmean(values[rows], axis=0)
+        std = np.nanstd(values[rows], axis=0)
+        scores[rows] = (values[rows] - mean) / np.where(std > 0, std, 1)
+
+    # All pairwise distances in one broadcast: (regions, regions, features)
+    differences = scores[:, None, :] - scores[None, :, :]
+    distances = np.sqrt(np.nansum(differences ** 2, axis=2))
+    distances[levels[:, None] != levels[None, :]] = np.nan
+    distances = pd.DataFrame(distances, index=profiles.index, columns=profiles.index)
+
+    percentiles = profiles.groupby(levels).rank(pct=True) * 100
+    return Peers(profiles, distances, percentiles)
+
+
+def nearest_peers(peers, region, count=5):
+    distances = peers.distances[region].drop(region).dropna()
+    return distances.nsmallest(count)
@@ -0,0 +1,198 @@
+"""Generate a printable HTML brief for each region.
+
+    python reports.py --out reports
+    python reports.py --regions "Jaranwala Tehsil" "Samundri Tehsil" --workers 4
+
+Each brief has metric cards, the literacy, out-of-school and
+never-attended charts from the dashboard, and a table of the region's
+figures. Regions are rendered in parallel on a process pool; every worker
+loads the data once and builds its briefs independently. Charts are
+embedded as static PNGs when kaleido is installed, and as interactive
+Plotly charts sharing one local copy of plotly.js otherwise.
+"""
+import argparse
+import base64
+import html
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import plotly.offline
+
+from charts import (
+    area_breakdown,
+    comparison_chart,
+    literacy_chart,
+    never_attended_bar,
+    oosc_chart,
+)
+from education_data import (
+    DATA_FILE_REGEX,
+    DISTRICT,
+    VALUE_COLUMNS,
+    build_cube,
+    data_file,
+    latest_year,
+    list_regions,
+    read_data,
+    slice_cube,
+)
+from formatting import number, percent
+
+try:
+    import kaleido  # noqa: F401 - enables fig.to_image
+    HAS_KALEIDO = True
+except ImportError:
+    HAS_KALEIDO = False
+
+LITERACY = 'Literate %'
+OUT_OF_SCHOOL = 'Out of School Children (5-16)'
+NEVER_ATTENDED = 'Never to School (5-16)'
+
+BRIEF_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+{scripts}
+<style>
+    body {{ font-family: 'Poppins', sans-serif; color: #2E2E2E; margin: 2rem; }}
+    h1 {{ color: #E5243B; margin-bottom: 0.2rem; }}
+    .subtitle {{ opacity: 0.8; margin-top: 0; }}
+    .cards {{ display: flex; gap: 1rem; margin: 1.5rem 0; }}
+    .metric-card {{ flex: 1; padding: 1rem 1.5rem; border: 1px solid #DEE2E6; border-radius: 10px; }}
+    .metric-value {{ font-size: 2rem; font-weight: 600; color: #E5243B; }}
+    .metric-label {{ font-size: 0.9rem; opacity: 0.7; }}
+    .chart {{ page-break-inside: avoid; margin: 1rem 0; }}
+    .chart img {{ width: 100%; }}
+    table {{ border-collapse: collapse; width: 100%; font-size: 0.85rem; }}
+    th, td {{ border: 1px solid #DEE2E6; padding: 0.3rem 0.6rem; text-align: right; }}
+    th {{ background-color: #FCE4E4; }}
+</style>
+</head>
+<body>
+<h1>{region}</h1>
+<p class="subtitle">Education Access Brief • Census {year}</p>
+<div class="cards">{cards}</div>
+{charts}
+<h2>Figures</h2>
+{table}
+</body>
+</html>
+"""
+
+# Cube and census year loaded once per worker process
+_cube = None
+_year = None
+
+
+def _init_worker(path, year):
+    global _cube, _year
+    _cube = build_cube(read_data(path))
+    _year = year
+
+
+def _data_year(path):
+    match = DATA_FILE_REGEX.fullmatch(os.path.basename(path))
+    return int(match.group(1)) if match else None
+
+
+def _metric_card(value, label):
+    return f"""
+<div class="metric-card">
+    <div class="metric-value">{value}</div>
+    <div class="metric-label">{html.escape(label)}</div>
+</div>"""
+
+
+def _embed(fig, images):
+    if images:
+        png = fig.to_image(format='png', width=1000, height=500)
+        return f'<div class="chart"><img src="data:image/png;base64,{base64.b64encode(png).decode()}"></div>'
+    return f'<div class="chart">{fig.to_html(full_html=False, include_plotlyjs=False)}</div>'
+
+
+def _filename(region):
+    return re.sub(r'[^A-Za-z0-9]+', '_', region).strip('_') + '.html'
+
+
+def build_brief(cube, region, images, year=None):
+    both = [DISTRICT, region] if region != DISTRICT else [DISTRICT]
+    totals = cube.xs((region, 'Total'), level=('Region', 'AreaType'))
+
+    cards = ''.join([
+        _metric_card(number(totals.loc[OUT_OF_SCHOOL, 'Total']), "Out-of-school children (5-16)"),
+        _metric_card(percent(totals.loc[LITERACY, 'Total']), "Literacy rate"),
+        _metric_card(number(totals.loc[NEVER_ATTENDED, 'Total']), "Children never attended school"),
+    ])
+
+    literacy_data = slice_cube(cube, LITERACY, both, ['Total'], ['Male', 'Female'])
+    oosc_data = slice_cube(cube, OUT_OF_SCHOOL, [region], ['Total'], ['Male', 'Female'])
+    urban_rural_data = slice_cube(cube, OUT_OF_SCHOOL, [region], ['Urban', 'Rural'], ['Total'])
+    never_data = area_breakdown(
+        slice_cube(cube, NEVER_ATTENDED, [region], ['Urban', 'Rural'], VALUE_COLUMNS),
+        'Total'
+    )
+    figures = [
+        literacy_chart(literacy_data, LITERACY, ['Male', 'Female']),
+        oosc_chart(oosc_data, OUT_OF_SCHOOL, ['Male', 'Female']),
+        comparison_chart(urban_rural_data, OUT_OF_SCHOOL, 'Total'),
+        never_attended_bar(never_data, 'Total'),
+    ]
+
+    table = cube.xs(region, level='Region').unstack('AreaType')['Total']
+    return BRIEF_TEMPLATE.format(
+        title=html.escape(f"{region} - Education Access Brief"),
+        scripts='' if images else '<script src="plotly.min.js"></script>',
+        region=html.escape(region),
+        year=latest_year() if year is None else year,
+        cards=cards,
+        charts='\n'.join(_embed(fig, images) for fig in figures),
+        table=table.to_html(float_format=lambda x: f"{x:,.2f}".rstrip('0').rstrip('.'), na_rep='–'),
+    )
+
+
+def render_brief(region, out_dir, images):
+    path = os.path.join(out_dir, _filename(region))
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(build_brief(_cube, region, images, _year))
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render an HTML education brief per region.")
+    parser.add_argument('--out', default='reports', help="Output directory")
+    parser.add_argument('--regions', nargs='+', help="Regions to render (default: all)")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--data', default=None, help="CSV file to report on (default: latest data_<year>.csv)")
+    parser.add_argument('--year', type=int, default=None,
+                        help="Census year (default: taken from a data_<year>.csv file name)")
+    parser.add_argument('--no-images', action='store_true',
+                        help="Embed interactive charts even when kaleido is available")
+    args = parser.parse_args()
+    args.data = args.data or data_file()
+
+    year = args.year or _data_year(args.data)
+    if year is None:
+        parser.error(f"cannot tell the census year from {args.data}; pass --year")
+    available = list_regions(build_cube(read_data(args.data)))
+    regions = args.regions or available
+    unknown = [region for region in regions if region not in available]
+    if unknown:
+        parser.error(f"unknown region(s): {', '.join(unknown)}")
+    images = HAS_KALEIDO and not args.no_images
+    os.makedirs(args.out, exist_ok=True)
+    if not images:
+        # One shared copy of plotly.js for every brief in the directory
+        with open(os.path.join(args.out, 'plotly.min.js'), 'w', encoding='utf-8') as f:
+            f.write(plotly.offline.get_plotlyjs())
+
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker,
+                             initargs=(args.data, year)) as pool:
+        futures = {pool.submit(render_brief, region, args.out, images): region for region in regions}
+        for done, future in enumerate(as_completed(futures), start=1):
+            print(f"[{done}/{len(futures)}] {futures[future]} -> {future.result()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+# The model works on the finest cells the census gives: (Region, AreaType,
+# gender) with Urban/Rural and Male/Female. Out-of-school children (5-16)
+# are never-attended plus drop-outs, and each intervention moves children
+# between those pools and enrolment:
+#
+# * ``enrolment_change``: school-age enrolment (primary to matric) rises by
+#   this fraction; the new pupils come out of the out-of-school pool in
+#   proportion to its never-attended and drop-out shares.
+# * ``dropout_change`` / ``never_attended_change``: the remaining drop-outs
+#   or never-attended children fall by this fraction.
+#
+# Every effect is uncertain by ``uncertainty`` (a fraction of the effect);
+# all Monte Carlo draws are simulated together as (draws, cells) arrays.
+Intervention = namedtuple('Intervention', [
+    'regions',
+    'area_types',
+    'genders',
+    'enrolment_change',
+    'dropout_change',
+    'never_attended_change',
+    'uncertainty',
+])
+
+Baseline = namedtuple('Baseline', ['cells', 'enrolment', 'dropouts', 'never_attended', 'never_attended_all'])
+
+Simulation = namedtuple('Simulation', ['cells', 'baseline', 'draws'])
+
+ENROLMENT_STAGES = ['Enrolment Primary', 'Enrolment Middle', 'Enrolment Matric']
+METRICS = ['Out of School Children (5-16)', 'Never to School (5-16)', 'Drop Out (5-16)',
+           'Never to School (all)', 'School-age Enrolment']
+
+
+def build_baseline(cube):
+    data = cube[
+        cube.index.get_level_values('AreaType').isin(['Urban', 'Rural'])
+        & ~cube.index.get_level_values('Region').str.endswith('District')
+    ][['Male', 'Female']]
+    # One row per (Region, AreaType, gender), one column per indicator
+    wide = data.stack().unstack('Indicator')
+    wide.index = wide.index.set_names('Gender', level=-1)
+
+    def column(indicator):
+        return wide[indicator].to_numpy(dtype=float)
+
+    return Baseline(
+        cells=wide.index,
+        enrolment=wide[ENROLMENT_STAGES].sum(axis=1).to_numpy(dtype=float),
+        dropouts=column('Drop Out (5-16)'),
+        never_attended=column('Never to School (5-16)'),
+        never_attended_all=column('Never to School (all)'),
+    )
+
+
+def _target_mask(cells, intervention):
+    return (
+        cells.get_level_values('Region').isin(intervention.regions)
+        & cells.get_level_values('AreaType').isin(intervention.area_types)
+        & cells.get_level_values('Gender').isin(intervention.genders)
+    )
+
+
+def _draw_effects(rng, effect, uncertainty, draws):
+    # Symmetric triangular spread of +/- uncertainty around the effect
+    spread = rng.random(draws) + rng.random(draws) - 1
+    return effect * (1 + uncertainty * spread)
+
+
+def simulate(baseline, interventions, draws=5000, seed=0):
+    """Simulate every draw at once; returns per-draw, per-cell metrics.
+
+    ``Simulation.draws`` maps each metric to a (draws, cells) array and
+    ``Simulation.baseline`` to its (cells,) starting values.
+    """
+    rng = np.random.default_rng(seed)
+    cells = len(baseline.cells)
+    enrolment = np.broadcast_to(baseline.enrolment, (draws, cells)).copy()
+    dropouts = np.broadcast_to(baseline.dropouts, (draws, cells)).copy()
+    never_attended = np.broadcast_to(baseline.never_attended, (draws, cells)).copy()
+
+    for intervention in interventions:
+        mask = _target_mask(baseline.cells, intervention)[None, :]
+        if not mask.any():
+            continue
+
+        # New pupils, capped by the out-of-school children available
+        gain = _draw_effects(rng, intervention.enrolment_change, intervention.uncertainty, draws)
+        out_of_school = dropouts + never_attended
+        new_pupils = np.clip(gain[:, None] * baseline.enrolment, 0, out_of_school) * mask
+        with np.errstate(divide='ignore', invalid='ignore'):
+            never_share = np.where(out_of_school > 0, never_attended / out_of_school, 0)
+        enrolment += new_pupils
+        never_attended -= new_pupils * never_share
+        dropouts -= new_pupils * (1 - never_share)
+
+        for pool, change in ((dropouts, intervention.dropout_change),
+                             (never_attended, intervention.never_attended_change)):
+            reduction = _draw_effects(rng, change, intervention.uncertainty, draws)
+            pool *= 1 - np.clip(reduction, 0, 1)[:, None] * mask
+
+    never_attended_drop = baseline.never_attended - never_attended
+    return Simulation(
+        cells=baseline.cells,
+        baseline={
+            'Out of School Children (5-16)': baseline.dropouts + baseline.never_attended,
+            'Never to School (5-16)': baseline.never_attended,
+            'Drop Out (5-16)': baseline.dropouts,
+            'Never to School (all)': baseline.never_attended_all,
+            'School-age Enrolment': baseline.enrolment,
+        },
+        draws={
+            'Out of School Children (5-16)': dropouts + never_attended,
+            'Never to School (5-16)': never_attended,
+            'Drop Out (5-16)': dropouts,
+            'Never to School (all)': baseline.never_attended_all - never_attended_drop,
+            'School-age Enrolment': enrolment,
+        },
+    )
+
+
+def summarise(simulation, metric, level='Region'):
+    """Mean change and 5th/95th percentile change per ``level`` and overall."""
+    change = simulation.draws[metric] - simulation.baseline[metric]
+    groups = simulation.cells.get_level_values(level)
+    names = pd.unique(groups)
+    # (draws, cells) @ (cells, groups): every group total for every draw
+    membership = (np.asarray(groups)[:, None] == names[None, :]).astype(float)
+    grouped = change @ membership
+    totals = change.sum(axis=1)
+
+    rows = np.column_stack([
+        np.append(grouped.mean(axis=0), totals.mean()),
+        np.append(np.percentile(grouped, 5, axis=0), np.percentile(totals, 5)),
+        np.append(np.percentile(grouped, 95, axis=0), np.percentile(totals, 95)),
+    ])
+    index = pd.Index(list(names) + ['All'], name=level)
+    return pd.DataFrame(rows, index=index, columns=['Mean change', '5th percentile', '95th percentile'])
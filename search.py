@@ -0,0 +1,89 @@
+import re
+from collections import namedtuple
+
+import numpy as np
+
+Suggestion = namedtuple('Suggestion', ['label', 'kind', 'score'])
+
+# Entries kept per trie node; shortest labels first
+MAX_PREFIX_HITS = 50
+# Trigram (Dice) similarity below which fuzzy matches are dropped
+MIN_SIMILARITY = 0.3
+
+
+def normalise(text):
+    return ' '.join(re.sub(r'[^0-9a-z]+', ' ', text.lower()).split())
+
+
+def trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex:
+    """Prefix trie and trigram index over labels such as regions and indicators.
+
+    Prefix matches (of the whole label or of any word in it) rank first;
+    everything else is ranked by trigram similarity, which tolerates typos
+    such as 'intermediate' for 'Enrolment Intermidiate'.
+    """
+
+    def __init__(self, entries):
+        # entries: iterable of (label, kind)
+        self.entries = sorted(set(entries), key=lambda entry: (len(entry[0]), entry[0]))
+        self.labels = [normalise(label) for label, _ in self.entries]
+
+        # Trie over every word suffix of the label, e.g. 'jaranwala tehsil'
+        # and 'tehsil', so a query can start at any word
+        self._trie = {}
+        for entry, label in enumerate(self.labels):
+            words = label.split(' ')
+            for start in range(len(words)):
+                node = self._trie
+                for char in ' '.join(words[start:]):
+                    node = node.setdefault(char, {})
+                    hits = node.setdefault('', [])
+                    if len(hits) < MAX_PREFIX_HITS:
+                        hits.append((entry, start))
+
+        grams = {}
+        self._gram_counts = np.zeros(len(self.labels))
+        for entry, label in enumerate(self.labels):
+            label_grams = trigrams(label)
+            self._gram_counts[entry] = len(label_grams)
+            for gram in label_grams:
+                grams.setdefault(gram, []).append(entry)
+        self._grams = {gram: np.array(ids) for gram, ids in grams.items()}
+
+    def _prefix_hits(self, query):
+        node = self._trie
+        for char in query:
+            node = node.get(char)
+            if node is None:
+                return []
+        return node['']
+
+    def suggest(self, query, limit=8):
+        query = normalise(query)
+        if not query:
+            return []
+        scores = np.zeros(len(self.labels))
+
+        # Dice similarity of trigram sets, counted for all labels at once
+        query_grams = trigrams(query)
+        postings = [self._grams[gram] for gram in query_grams if gram in self._grams]
+        if postings:
+            shared = np.bincount(np.concatenate(postings), minlength=len(self.labels))
+            scores = 2 * shared / (len(query_grams) + self._gram_counts)
+            scores[scores < MIN_SIMILARITY] = 0
+
+        # Whole-label prefixes beat word prefixes, which beat fuzzy matches;
+        # similarity breaks ties within each group
+        bonus = np.zeros(len(self.labels))
+        for entry, start in self._prefix_hits(query):
+            bonus[entry] = max(bonus[entry], 4 if start == 0 else 2)
+        scores = scores + bonus
+
+        candidates = np.flatnonzero(scores)
+        best = candidates[np.argsort(-scores[candidates], kind='stable')[:limit]]
+        return [Suggestion(*self.entries[entry], float(scores[entry])) for entry in best]
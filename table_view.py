@@ -0,0 +1,31 @@
+import math
+
+import streamlit as st
+
+PAGE_SIZES = [10, 25, 50, 100]
+
+
+def render_paged_table(table, key, default_sort=None, column_config=None):
+    """Sort, filter and page a PagedTable, sending only the visible rows."""
+    col1, col2, col3, col4 = st.columns([3, 2, 1, 1])
+    with col1:
+        query = st.text_input("Filter", key=f'{key}_query', placeholder="Type to filter rows")
+    with col2:
+        sort_column = st.selectbox(
+            "Sort by",
+            table.columns,
+            index=table.columns.index(default_sort) if default_sort else 0,
+            key=f'{key}_sort'
+        )
+    with col3:
+        ascending = st.radio("Order", ["Asc", "Desc"], key=f'{key}_order') == "Asc"
+    with col4:
+        page_size = st.selectbox("Rows", PAGE_SIZES, index=1, key=f'{key}_page_size')
+
+    total = len(table.order(sort_column, ascending, query))
+    pages = max(1, math.ceil(total / page_size))
+    page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1, key=f'{key}_page')
+    rows, total = table.page(min(page, pages) - 1, page_size, sort_column, ascending, query)
+
+    st.dataframe(rows, column_config=column_config, hide_index=True, use_container_width=True)
+    st.caption(f"{total:,} matching rows")
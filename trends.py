@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+
+from education_data import VALUE_COLUMNS
+
+# Indicators shown as year-over-year changes
+TREND_INDICATORS = [
+    'Literate %',
+    'Out of School Children (5-16)',
+    'Never to School (5-16)',
+    'Never to School (all)',
+]
+
+
+def align_years(cubes):
+    """Stack per-year cubes on the (Region, AreaType, Indicator) keys they share.
+
+    ``cubes`` maps year -> cube. Returns ``(years, keys, values)`` where
+    ``values`` has shape (years, keys, genders), so any comparison between
+    years is plain array arithmetic instead of a table join.
+    """
+    years = sorted(cubes)
+    keys = cubes[years[0]].index
+    for year in years[1:]:
+        keys = keys.intersection(cubes[year].index)
+    keys = keys.sort_values()
+    values = np.stack([
+        cubes[year].reindex(keys)[VALUE_COLUMNS].to_numpy(dtype=float) for year in years
+    ])
+    return years, keys, values
+
+
+def year_over_year(cubes):
+    """Change and growth rate between each pair of consecutive years.
+
+    Returns ``(changes, growth)``, both indexed by (Period, Region, AreaType,
+    Indicator) with one column per gender. Growth is in percent of the
+    earlier year and NaN where the earlier value is 0. Percentage
+    indicators such as 'Literate %' change in percentage points.
+    """
+    years, keys, values = align_years(cubes)
+    changes = values[1:] - values[:-1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        growth = changes / values[:-1] * 100
+    growth[~np.isfinite(growth)] = np.nan
+
+    periods = [f"{start}→{end}" for start, end in zip(years, years[1:])]
+    index = pd.MultiIndex.from_tuples(
+        [(period,) + key for period in periods for key in keys],
+        names=['Period'] + list(keys.names)
+    )
+    shape = (len(periods) * len(keys), len(VALUE_COLUMNS))
+    return (
+        pd.DataFrame(changes.reshape(shape), index=index, columns=VALUE_COLUMNS),
+        pd.DataFrame(growth.reshape(shape), index=index, columns=VALUE_COLUMNS),
+    )